@@ -13,23 +13,130 @@ import threading
 from typing import Optional, Callable, Dict, Any
 import argparse
 import os
+from contextlib import suppress
 import ssl
 import asyncio
 import websockets
 from websockets.client import WebSocketClientProtocol
 from base64 import b64encode
+from functools import lru_cache
 import logging
-import os
+import traceback
+import urllib3
 
 # Configuration par défaut
 DEFAULT_POLLING_FREQUENCY = 4  # fois par seconde
 DEFAULT_TARGET_VALUE = None  # Aucune valeur cible par défaut
 CONFIG_FILE = "focus_config.json"
 
+# En-têtes HTTP partagés par toutes les requêtes REST (ne pas modifier)
+JSON_HEADERS = {'Accept': 'application/json', 'Content-Type': 'application/json'}
+ACCEPT_JSON_HEADERS = {'Accept': 'application/json'}
+
+# Durée de validité du cache des capacités de la caméra (descriptions, gains/shutters supportés)
+CAPABILITY_CACHE_TTL = 5.0  # secondes
+
+# Modes de mesure du shutter acceptés par la caméra
+SHUTTER_MEASUREMENT_MODES = ('ShutterAngle', 'ShutterSpeed')
+
+# Commandes quittant le mode interactif
+QUIT_COMMANDS = ('quit', 'exit', 'q')
+
+# Messages d'erreur spécifiques des paramètres on/off, par code HTTP
+ZEBRA_STATUS_MESSAGES = {
+    400: "Erreur: Entrée invalide (400)",
+    422: "Erreur: Impossible de traiter les instructions (422)",
+}
+FOCUS_ASSIST_STATUS_MESSAGES = {
+    400: "Erreur: Entrée invalide ou configuration invalide (400)",
+    422: "Erreur: Impossible de traiter les instructions (422)",
+}
+
+# Aide du mode interactif (affichée en une seule écriture)
+INTERACTIVE_COMMANDS_HELP = "\n".join([
+    "  <valeur>          - Définir le focus (ex: 0.5)",
+    "  get               - Lire la valeur actuelle",
+    "  save <valeur>     - Définir et sauvegarder dans la config",
+    "  sweep             - Balayer le focus de 0 à 1 progressivement",
+    "  sweep <start> <end> <steps> <delay> - Balayer de start à end",
+    "  sweep infinite    - Balayer en allers-retours à l'infini",
+    "  sweep <start> <end> <steps> <delay> infinite - Balayer infini personnalisé",
+    "  watch             - Activer la surveillance du fichier config",
+    "  unwatch           - Désactiver la surveillance du fichier config",
+    "  help              - Afficher cette aide",
+    "  quit / exit       - Quitter",
+])
+
+
+# Correspondance chemin de propriété WebSocket -> type de paramètre, testée dans l'ordre
+PROPERTY_PARAM_TYPES = (
+    (('/lens/focus',), 'focus'),
+    (('/lens/iris',), 'iris'),
+    (('/lens/zoom',), 'zoom'),
+    (('/video/gain',), 'gain'),
+    (('/video/shutter',), 'shutter'),
+    (('/monitoring/HDMI/zebra', '/video/zebra'), 'zebra'),
+    (('/monitoring/HDMI/focusAssist', '/video/focusAssist'), 'focusAssist'),
+    (('/monitoring/HDMI/falseColor', '/video/falseColor'), 'falseColor'),
+    (('/monitoring/HDMI/cleanfeed', '/video/cleanfeed'), 'cleanfeed'),
+)
+
+# Clé sous laquelle une valeur scalaire reçue par WebSocket est enveloppée
+# pour reproduire le format de l'API REST (zoom et shutter sont transmis tels quels)
+SCALAR_VALUE_KEYS = {
+    'focus': 'normalised',
+    'iris': 'normalised',
+    'gain': 'gain',
+    'zebra': 'enabled',
+    'focusAssist': 'enabled',
+    'falseColor': 'enabled',
+    'cleanfeed': 'enabled',
+}
+
+
+@lru_cache(maxsize=64)
+def property_param_type(prop_path: str) -> Optional[str]:
+    """
+    Retourne le type de paramètre ('focus', 'iris', ...) d'un chemin de propriété WebSocket.
+    
+    Le résultat est mis en cache : la caméra n'émet qu'une poignée de chemins distincts.
+    
+    Args:
+        prop_path: Chemin de la propriété (ex: '/lens/focus')
+    
+    Returns:
+        Le type de paramètre, ou None si le chemin n'est pas suivi
+    """
+    for fragments, param_type in PROPERTY_PARAM_TYPES:
+        for fragment in fragments:
+            if fragment in prop_path:
+                return param_type
+    return None
+
 
 class BlackmagicWebSocketClient:
     """Client WebSocket pour s'abonner aux changements de paramètres de la caméra Blackmagic."""
     
+    # Message d'abonnement selon la documentation Blackmagic Design, sérialisé une seule fois
+    # Format: {"type": "request", "data": {"action": "subscribe", "properties": ["*"]}}
+    # Pour s'abonner à toutes les propriétés, ou spécifier les chemins exacts
+    SUBSCRIBE_MESSAGE = json.dumps({
+        "type": "request",
+        "data": {
+            "action": "subscribe",
+            "properties": [
+                "/lens/focus",
+                "/lens/iris",
+                "/lens/zoom",
+                "/video/gain",
+                "/video/shutter",
+                "/monitoring/HDMI/zebra",
+                "/monitoring/HDMI/focusAssist",
+                "/monitoring/HDMI/falseColor"
+            ]
+        }
+    })
+    
     def __init__(self, base_url: str, username: str = "roo", password: str = "koko", on_change_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None, on_connection_status_callback: Optional[Callable[[bool, str], None]] = None):
         """
         Initialise le client WebSocket.
@@ -58,12 +165,17 @@ class BlackmagicWebSocketClient:
         self.thread: Optional[threading.Thread] = None
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
+        # Contexte SSL créé une seule fois et réutilisé à chaque reconnexion
+        self.ssl_context = None if 'ws://' in self.ws_url else ssl.create_default_context()
         
         # Créer les headers d'authentification basique
         credentials = b64encode(f"{username}:{password}".encode()).decode('ascii')
         self.auth_headers = {
             'Authorization': f'Basic {credentials}'
         }
+        # websockets 15.0.1 utilise additional_headers (liste de tuples) au lieu de extra_headers
+        # La liste est construite une fois et réutilisée à chaque reconnexion
+        self.additional_headers = list(self.auth_headers.items())
         
         self.logger.info(f"Initialisation WebSocket client - URL: {self.ws_url}")
     
@@ -103,11 +215,7 @@ class BlackmagicWebSocketClient:
     async def _connect_and_listen(self):
         """Se connecte et écoute les messages WebSocket avec reconnexion automatique."""
         # Notifier qu'on essaie de se connecter
-        if self.on_connection_status_callback:
-            try:
-                self.on_connection_status_callback(False, "Tentative de connexion...")
-            except Exception:
-                pass
+        self._notify_connection_status(False, "Tentative de connexion...")
         
         while self.running:
             try:
@@ -118,15 +226,11 @@ class BlackmagicWebSocketClient:
                 # selon l'implémentation de l'API Blackmagic
                 # Ajout d'un timeout pour éviter les blocages
                 try:
-                    # websockets 15.0.1 utilise additional_headers (liste de tuples) au lieu de extra_headers
-                    # Convertir le dict en liste de tuples pour additional_headers
-                    additional_headers = list(self.auth_headers.items())
-                    
                     websocket = await asyncio.wait_for(
                         websockets.connect(
                             self.ws_url,
-                            additional_headers=additional_headers,
-                            ssl=None if 'ws://' in self.ws_url else ssl.create_default_context(),
+                            additional_headers=self.additional_headers,
+                            ssl=self.ssl_context,
                             ping_interval=None,
                             ping_timeout=None
                         ),
@@ -141,11 +245,7 @@ class BlackmagicWebSocketClient:
                     self.logger.info(f"✓ WebSocket connecté avec succès à {self.ws_url}")
                     
                     # Notifier la connexion réussie
-                    if self.on_connection_status_callback:
-                        try:
-                            self.on_connection_status_callback(True, "WebSocket caméra connecté")
-                        except Exception as e:
-                            self.logger.error(f"Erreur dans on_connection_status_callback: {e}")
+                    self._notify_connection_status(True, "WebSocket caméra connecté")
                     
                     # S'abonner aux changements de tous les paramètres
                     await self._subscribe_to_all()
@@ -166,61 +266,46 @@ class BlackmagicWebSocketClient:
                     self.logger.error(f"URL WebSocket invalide: {e}")
                     self.logger.error(f"URL utilisée: {self.ws_url}")
                     self.logger.error("Vérifiez que l'endpoint WebSocket est correct selon la documentation (page 71)")
-                    if self.on_connection_status_callback:
-                        try:
-                            self.on_connection_status_callback(False, f"URL WebSocket invalide: {e}")
-                        except Exception:
-                            pass
+                    self._notify_connection_status(False, f"URL WebSocket invalide: {e}")
                     await asyncio.sleep(self.reconnect_delay)
             except websockets.exceptions.InvalidHandshake as e:
                 if self.running:
                     self.logger.error(f"Échec du handshake WebSocket: {e}")
                     self.logger.error("Vérifiez l'authentification et l'endpoint WebSocket")
-                    if self.on_connection_status_callback:
-                        try:
-                            self.on_connection_status_callback(False, f"Échec authentification: {e}")
-                        except Exception:
-                            pass
+                    self._notify_connection_status(False, f"Échec authentification: {e}")
                     await asyncio.sleep(self.reconnect_delay)
             except websockets.exceptions.ConnectionClosed as e:
                 if self.running:
                     self.logger.warning(f"Connexion WebSocket fermée (code: {e.code}, raison: {e.reason}), reconnexion dans {self.reconnect_delay}s...")
-                    if self.on_connection_status_callback:
-                        try:
-                            self.on_connection_status_callback(False, f"Connexion fermée (code: {e.code})")
-                        except Exception:
-                            pass
+                    self._notify_connection_status(False, f"Connexion fermée (code: {e.code})")
                     await asyncio.sleep(self.reconnect_delay)
             except OSError as e:
                 if self.running:
                     self.logger.error(f"Erreur réseau WebSocket: {e}")
                     self.logger.error(f"Vérifiez que la caméra est accessible à {self.base_url}")
-                    if self.on_connection_status_callback:
-                        try:
-                            self.on_connection_status_callback(False, f"Erreur réseau: {e}")
-                        except Exception:
-                            pass
+                    self._notify_connection_status(False, f"Erreur réseau: {e}")
                     await asyncio.sleep(self.reconnect_delay)
             except Exception as e:
                 if self.running:
                     self.logger.error(f"Erreur WebSocket inattendue: {type(e).__name__}: {e}")
-                    import traceback
                     self.logger.error(traceback.format_exc())
-                    if self.on_connection_status_callback:
-                        try:
-                            self.on_connection_status_callback(False, f"Erreur: {type(e).__name__}")
-                        except Exception:
-                            pass
+                    self._notify_connection_status(False, f"Erreur: {type(e).__name__}")
                     await asyncio.sleep(self.reconnect_delay)
             finally:
                 was_connected = self.websocket is not None
                 self.websocket = None
                 # Notifier la déconnexion si on était connecté
-                if was_connected and self.on_connection_status_callback:
-                    try:
-                        self.on_connection_status_callback(False, "Déconnecté")
-                    except Exception:
-                        pass
+                if was_connected:
+                    self._notify_connection_status(False, "Déconnecté")
+    
+    def _notify_connection_status(self, connected: bool, message: str):
+        """Notifie le callback d'état de connexion, sans propager ses erreurs."""
+        if not self.on_connection_status_callback:
+            return
+        try:
+            self.on_connection_status_callback(connected, message)
+        except Exception as e:
+            self.logger.error(f"Erreur dans on_connection_status_callback: {e}")
     
     async def _subscribe_to_all(self):
         """S'abonne aux changements de tous les paramètres."""
@@ -228,27 +313,7 @@ class BlackmagicWebSocketClient:
             return
         
         try:
-            # Format d'abonnement selon la documentation Blackmagic Design
-            # Format: {"type": "request", "data": {"action": "subscribe", "properties": ["*"]}}
-            # Pour s'abonner à toutes les propriétés, ou spécifier les chemins exacts
-            subscribe_msg = {
-                "type": "request",
-                "data": {
-                    "action": "subscribe",
-                    "properties": [
-                        "/lens/focus",
-                        "/lens/iris",
-                        "/lens/zoom",
-                        "/video/gain",
-                        "/video/shutter",
-                        "/monitoring/HDMI/zebra",
-                        "/monitoring/HDMI/focusAssist",
-                        "/monitoring/HDMI/falseColor"
-                    ]
-                }
-            }
-            
-            await self.websocket.send(json.dumps(subscribe_msg))
+            await self.websocket.send(self.SUBSCRIBE_MESSAGE)
             self.logger.info("Abonnement envoyé pour tous les paramètres")
         except Exception as e:
             self.logger.error(f"Erreur lors de l'abonnement: {e}")
@@ -258,7 +323,8 @@ class BlackmagicWebSocketClient:
         try:
             data = json.loads(message)
             
-            self.logger.debug(f"Message WebSocket reçu: {data}")
+            # Formatage paresseux (%s) : rien n'est construit si le niveau DEBUG est inactif
+            self.logger.debug("Message WebSocket reçu: %s", data)
             
             # Format selon la documentation Blackmagic Design
             # Les messages peuvent être de type "event" ou "response"
@@ -274,51 +340,28 @@ class BlackmagicWebSocketClient:
                     prop_path = event_data.get('property', '')
                     prop_value = event_data.get('value', {})
                     
-                    param_type = None
+                    param_type = property_param_type(prop_path)
                     
-                    # Déterminer le type de paramètre selon le chemin
-                    if '/lens/focus' in prop_path:
-                        param_type = 'focus'
-                        # Format: {"normalised": 0.5}
-                        param_data = prop_value if isinstance(prop_value, dict) else {'normalised': prop_value}
-                    elif '/lens/iris' in prop_path:
-                        param_type = 'iris'
-                        param_data = prop_value if isinstance(prop_value, dict) else {'normalised': prop_value}
-                    elif '/lens/zoom' in prop_path:
-                        param_type = 'zoom'
-                        param_data = prop_value if isinstance(prop_value, dict) else prop_value
-                    elif '/video/gain' in prop_path:
-                        param_type = 'gain'
-                        param_data = prop_value if isinstance(prop_value, dict) else {'gain': prop_value}
-                    elif '/video/shutter' in prop_path:
-                        param_type = 'shutter'
-                        param_data = prop_value if isinstance(prop_value, dict) else prop_value
-                    elif '/monitoring/HDMI/zebra' in prop_path or '/video/zebra' in prop_path:
-                        param_type = 'zebra'
-                        param_data = prop_value if isinstance(prop_value, dict) else {'enabled': prop_value}
-                    elif '/monitoring/HDMI/focusAssist' in prop_path or '/video/focusAssist' in prop_path:
-                        param_type = 'focusAssist'
-                        param_data = prop_value if isinstance(prop_value, dict) else {'enabled': prop_value}
-                    elif '/monitoring/HDMI/falseColor' in prop_path or '/video/falseColor' in prop_path:
-                        param_type = 'falseColor'
-                        param_data = prop_value if isinstance(prop_value, dict) else {'enabled': prop_value}
-                    elif '/monitoring/HDMI/cleanfeed' in prop_path or '/video/cleanfeed' in prop_path:
-                        param_type = 'cleanfeed'
-                        param_data = prop_value if isinstance(prop_value, dict) else {'enabled': prop_value}
+                    # Les valeurs scalaires sont enveloppées dans le format de l'API REST
+                    wrap_key = SCALAR_VALUE_KEYS.get(param_type)
+                    if wrap_key is not None and not isinstance(prop_value, dict):
+                        param_data = {wrap_key: prop_value}
+                    else:
+                        param_data = prop_value
                     
                     if param_type and self.on_change_callback:
-                        self.logger.debug(f"Événement {param_type} reçu: {param_data}")
+                        self.logger.debug("Événement %s reçu: %s", param_type, param_data)
                         self.on_change_callback(param_type, param_data)
                 elif action == 'websocketOpened':
                     # Message de confirmation d'ouverture - on l'ignore
                     self.logger.debug("WebSocket ouvert confirmé")
                 else:
-                    self.logger.debug(f"Action d'événement non gérée: {action}")
+                    self.logger.debug("Action d'événement non gérée: %s", action)
             
             elif msg_type == 'response':
                 # Message de réponse - peut contenir des données initiales
                 response_data = data.get('data', {})
-                self.logger.debug(f"Réponse WebSocket reçue: {response_data}")
+                self.logger.debug("Réponse WebSocket reçue: %s", response_data)
                 # Les réponses peuvent contenir des données initiales, mais on les ignore
                 # car on récupère les valeurs initiales via HTTP
             
@@ -330,7 +373,6 @@ class BlackmagicWebSocketClient:
             self.logger.warning(f"Message WebSocket non-JSON reçu: {message}")
         except Exception as e:
             self.logger.error(f"Erreur lors du traitement du message WebSocket: {e}")
-            import traceback
             self.logger.error(traceback.format_exc())
 
 
@@ -347,33 +389,40 @@ class BlackmagicFocusController:
             password: Mot de passe pour l'authentification basique
         """
         self.base_url = base_url.rstrip('/')
-        self.focus_endpoint = f"{self.base_url}/control/api/v1/lens/focus"
-        self.iris_endpoint = f"{self.base_url}/control/api/v1/lens/iris"
-        self.iris_description_endpoint = f"{self.base_url}/control/api/v1/lens/iris/description"
-        self.zoom_endpoint = f"{self.base_url}/control/api/v1/lens/zoom"
-        self.zoom_description_endpoint = f"{self.base_url}/control/api/v1/lens/zoom/description"
-        self.gain_endpoint = f"{self.base_url}/control/api/v1/video/gain"
-        self.supported_gains_endpoint = f"{self.base_url}/control/api/v1/video/supportedGains"
-        self.shutter_endpoint = f"{self.base_url}/control/api/v1/video/shutter"
-        self.shutter_measurement_endpoint = f"{self.base_url}/control/api/v1/video/shutter/measurement"
-        self.supported_shutters_endpoint = f"{self.base_url}/control/api/v1/video/supportedShutters"
+        # Préfixe commun à tous les endpoints, calculé une seule fois
+        api_base = f"{self.base_url}/control/api/v1"
+        self.focus_endpoint = f"{api_base}/lens/focus"
+        self.iris_endpoint = f"{api_base}/lens/iris"
+        self.iris_description_endpoint = f"{api_base}/lens/iris/description"
+        self.zoom_endpoint = f"{api_base}/lens/zoom"
+        self.zoom_description_endpoint = f"{api_base}/lens/zoom/description"
+        self.gain_endpoint = f"{api_base}/video/gain"
+        self.supported_gains_endpoint = f"{api_base}/video/supportedGains"
+        self.shutter_endpoint = f"{api_base}/video/shutter"
+        self.shutter_measurement_endpoint = f"{api_base}/video/shutter/measurement"
+        self.supported_shutters_endpoint = f"{api_base}/video/supportedShutters"
         self.display_name = "HDMI"  # Display name fixe selon la documentation
-        self.zebra_endpoint = f"{self.base_url}/control/api/v1/monitoring/{self.display_name}/zebra"
-        self.focus_assist_endpoint = f"{self.base_url}/control/api/v1/monitoring/{self.display_name}/focusAssist"
-        self.false_color_endpoint = f"{self.base_url}/control/api/v1/monitoring/{self.display_name}/falseColor"
-        self.cleanfeed_endpoint = f"{self.base_url}/control/api/v1/monitoring/{self.display_name}/cleanFeed"
-        self.autofocus_endpoint = f"{self.base_url}/control/api/v1/lens/focus/doAutoFocus"
+        self.zebra_endpoint = f"{api_base}/monitoring/{self.display_name}/zebra"
+        self.focus_assist_endpoint = f"{api_base}/monitoring/{self.display_name}/focusAssist"
+        self.false_color_endpoint = f"{api_base}/monitoring/{self.display_name}/falseColor"
+        self.cleanfeed_endpoint = f"{api_base}/monitoring/{self.display_name}/cleanFeed"
+        self.autofocus_endpoint = f"{api_base}/lens/focus/doAutoFocus"
         self.auth = (username, password)
         self.current_value: Optional[float] = None
         self.target_value: Optional[float] = None
         self.polling_active = False
         self.polling_thread: Optional[threading.Thread] = None
+        # Réveillent immédiatement les boucles de fond à l'arrêt (au lieu d'attendre la fin du sleep)
+        self.polling_stop_event = threading.Event()
+        self.config_watch_stop_event = threading.Event()
         self.polling_frequency = DEFAULT_POLLING_FREQUENCY
         self.config_watch_active = False
         self.config_watch_thread: Optional[threading.Thread] = None
         self.last_config_mtime = 0
+        self.last_saved_target: Optional[float] = None  # dernière valeur lue/écrite dans CONFIG_FILE
         self.interactive_mode = False
         self.debug = False
+        self.capability_cache: Dict[str, tuple] = {}  # clé -> (instant monotonic, valeur)
         
         # Créer une session avec configuration SSL permissive
         self.session = requests.Session()
@@ -381,7 +430,6 @@ class BlackmagicFocusController:
         self.session.verify = False
         
         # Désactiver les avertissements SSL
-        import urllib3
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
         
         # Configuration pour gérer les certificats auto-signés
@@ -394,6 +442,27 @@ class BlackmagicFocusController:
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
+    def _get_cached_capability(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Retourne une capacité de la caméra (descriptions, valeurs supportées) depuis le cache.
+        
+        Ces valeurs ne changent qu'au changement d'objectif ou de cadence : elles sont
+        conservées CAPABILITY_CACHE_TTL secondes au lieu d'être redemandées à chaque appel.
+        Les échecs (None) ne sont pas mis en cache.
+        
+        Args:
+            key: Clé de cache
+            fetch: Fonction qui interroge la caméra
+        """
+        now = time.monotonic()
+        cached = self.capability_cache.get(key)
+        if cached is not None and now - cached[0] < CAPABILITY_CACHE_TTL:
+            return cached[1]
+        value = fetch()
+        if value is not None:
+            self.capability_cache[key] = (now, value)
+        return value
+    
     def get_focus(self) -> Optional[float]:
         """
         Récupère la valeur actuelle du focus.
@@ -409,7 +478,7 @@ class BlackmagicFocusController:
             response = self.session.get(
                 self.focus_endpoint,
                 timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
+                headers=JSON_HEADERS
             )
             
             if self.debug:
@@ -429,12 +498,17 @@ class BlackmagicFocusController:
             return None
         except requests.exceptions.RequestException as e:
             print(f"Erreur lors de la récupération du focus: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Status code: {e.response.status_code}")
-                print(f"Response: {e.response.text}")
+            error_response = e.response
+            if error_response is not None:
+                print(f"Status code: {error_response.status_code}")
+                print(f"Response: {error_response.text}")
             return None
     
     def get_iris_description(self) -> Optional[dict]:
+        """Retourne la description des capacités de l'iris (mise en cache CAPABILITY_CACHE_TTL secondes)."""
+        return self._get_cached_capability('iris_description', self._fetch_iris_description)
+    
+    def _fetch_iris_description(self) -> Optional[dict]:
         """
         Récupère la description détaillée des capacités de l'iris.
         
@@ -448,7 +522,7 @@ class BlackmagicFocusController:
             response = self.session.get(
                 self.iris_description_endpoint,
                 timeout=10,
-                headers={'Accept': 'application/json'}
+                headers=ACCEPT_JSON_HEADERS
             )
             
             if self.debug:
@@ -470,12 +544,17 @@ class BlackmagicFocusController:
         except requests.exceptions.RequestException as e:
             if self.debug:
                 print(f"Erreur lors de la récupération de la description de l'iris: {e}")
-                if hasattr(e, 'response') and e.response is not None:
-                    print(f"Status code: {e.response.status_code}")
-                    print(f"Response: {e.response.text}")
+                error_response = e.response
+                if error_response is not None:
+                    print(f"Status code: {error_response.status_code}")
+                    print(f"Response: {error_response.text}")
             return None
 
     def get_zoom_description(self) -> Optional[dict]:
+        """Retourne la description des capacités du zoom (mise en cache CAPABILITY_CACHE_TTL secondes)."""
+        return self._get_cached_capability('zoom_description', self._fetch_zoom_description)
+    
+    def _fetch_zoom_description(self) -> Optional[dict]:
         """
         Récupère la description détaillée des capacités du zoom.
         
@@ -486,7 +565,7 @@ class BlackmagicFocusController:
             response = self.session.get(
                 self.zoom_description_endpoint,
                 timeout=10,
-                headers={'Accept': 'application/json'}
+                headers=ACCEPT_JSON_HEADERS
             )
             response.raise_for_status()
             data = response.json()
@@ -511,7 +590,7 @@ class BlackmagicFocusController:
             response = self.session.get(
                 self.zoom_endpoint,
                 timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
+                headers=JSON_HEADERS
             )
             
             if self.debug:
@@ -533,9 +612,10 @@ class BlackmagicFocusController:
             return None
         except requests.exceptions.RequestException as e:
             print(f"Erreur lors de la récupération du zoom: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Status code: {e.response.status_code}")
-                print(f"Response: {e.response.text}")
+            error_response = e.response
+            if error_response is not None:
+                print(f"Status code: {error_response.status_code}")
+                print(f"Response: {error_response.text}")
             return None
     
     def set_focus(self, value: float, silent: bool = False) -> bool:
@@ -565,7 +645,7 @@ class BlackmagicFocusController:
                 self.focus_endpoint,
                 json=payload,
                 timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
+                headers=JSON_HEADERS
             )
             
             if self.debug:
@@ -586,9 +666,10 @@ class BlackmagicFocusController:
             return False
         except requests.exceptions.RequestException as e:
             print(f"Erreur lors de la mise à jour du focus: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Status code: {e.response.status_code}")
-                print(f"Response: {e.response.text}")
+            error_response = e.response
+            if error_response is not None:
+                print(f"Status code: {error_response.status_code}")
+                print(f"Response: {error_response.text}")
             return False
     
     def get_iris(self) -> Optional[dict]:
@@ -607,7 +688,7 @@ class BlackmagicFocusController:
             response = self.session.get(
                 self.iris_endpoint,
                 timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
+                headers=JSON_HEADERS
             )
             
             if self.debug:
@@ -631,9 +712,10 @@ class BlackmagicFocusController:
             return None
         except requests.exceptions.RequestException as e:
             print(f"Erreur lors de la récupération de l'iris: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Status code: {e.response.status_code}")
-                print(f"Response: {e.response.text}")
+            error_response = e.response
+            if error_response is not None:
+                print(f"Status code: {error_response.status_code}")
+                print(f"Response: {error_response.text}")
             return None
     
     def set_iris(self, value: float, silent: bool = False) -> bool:
@@ -664,7 +746,7 @@ class BlackmagicFocusController:
                 self.iris_endpoint,
                 json=payload,
                 timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
+                headers=JSON_HEADERS
             )
             
             if self.debug:
@@ -687,12 +769,17 @@ class BlackmagicFocusController:
         except requests.exceptions.RequestException as e:
             if not silent:
                 print(f"Erreur lors de la mise à jour de l'iris: {e}")
-                if hasattr(e, 'response') and e.response is not None:
-                    print(f"Status code: {e.response.status_code}")
-                    print(f"Response: {e.response.text}")
+                error_response = e.response
+                if error_response is not None:
+                    print(f"Status code: {error_response.status_code}")
+                    print(f"Response: {error_response.text}")
             return False
     
     def get_supported_gains(self) -> Optional[list]:
+        """Retourne la liste des gains supportés (mise en cache CAPABILITY_CACHE_TTL secondes)."""
+        return self._get_cached_capability('supported_gains', self._fetch_supported_gains)
+    
+    def _fetch_supported_gains(self) -> Optional[list]:
         """
         Récupère la liste des gains supportés en décibels.
         
@@ -707,7 +794,7 @@ class BlackmagicFocusController:
             response = self.session.get(
                 self.supported_gains_endpoint,
                 timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
+                headers=JSON_HEADERS
             )
             
             if self.debug:
@@ -726,9 +813,10 @@ class BlackmagicFocusController:
             return None
         except requests.exceptions.RequestException as e:
             print(f"Erreur lors de la récupération des gains supportés: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Status code: {e.response.status_code}")
-                print(f"Response: {e.response.text}")
+            error_response = e.response
+            if error_response is not None:
+                print(f"Status code: {error_response.status_code}")
+                print(f"Response: {error_response.text}")
             return None
     
     def get_gain(self) -> Optional[int]:
@@ -746,7 +834,7 @@ class BlackmagicFocusController:
             response = self.session.get(
                 self.gain_endpoint,
                 timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
+                headers=JSON_HEADERS
             )
             
             if self.debug:
@@ -765,9 +853,10 @@ class BlackmagicFocusController:
             return None
         except requests.exceptions.RequestException as e:
             print(f"Erreur lors de la récupération du gain: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Status code: {e.response.status_code}")
-                print(f"Response: {e.response.text}")
+            error_response = e.response
+            if error_response is not None:
+                print(f"Status code: {error_response.status_code}")
+                print(f"Response: {error_response.text}")
             return None
     
     def set_gain(self, value: int, silent: bool = False) -> bool:
@@ -793,7 +882,7 @@ class BlackmagicFocusController:
                 self.gain_endpoint,
                 json=payload,
                 timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
+                headers=JSON_HEADERS
             )
             
             if self.debug:
@@ -816,12 +905,13 @@ class BlackmagicFocusController:
         except requests.exceptions.RequestException as e:
             if not silent:
                 print(f"Erreur lors de la mise à jour du gain: {e}")
-                if hasattr(e, 'response') and e.response is not None:
-                    status_code = e.response.status_code
+                error_response = e.response
+                if error_response is not None:
+                    status_code = error_response.status_code
                     print(f"Status code: {status_code}")
                     if status_code == 403:
                         print("Le gain ne peut pas être modifié dans l'état actuel de la caméra")
-                    print(f"Response: {e.response.text}")
+                    print(f"Response: {error_response.text}")
             return False
     
     def get_shutter_measurement(self) -> Optional[str]:
@@ -838,7 +928,7 @@ class BlackmagicFocusController:
             response = self.session.get(
                 self.shutter_measurement_endpoint,
                 timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
+                headers=JSON_HEADERS
             )
             
             if self.debug:
@@ -850,8 +940,9 @@ class BlackmagicFocusController:
             return data.get('measurement')
         except requests.exceptions.RequestException as e:
             print(f"Erreur lors de la récupération du mode shutter: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Status code: {e.response.status_code}")
+            error_response = e.response
+            if error_response is not None:
+                print(f"Status code: {error_response.status_code}")
             return None
     
     def set_shutter_measurement(self, mode: str, silent: bool = False) -> bool:
@@ -865,7 +956,7 @@ class BlackmagicFocusController:
         Returns:
             True si la mise à jour a réussi, False sinon
         """
-        if mode not in ['ShutterAngle', 'ShutterSpeed']:
+        if mode not in SHUTTER_MEASUREMENT_MODES:
             if not silent:
                 print(f"Erreur: Le mode doit être 'ShutterAngle' ou 'ShutterSpeed', reçu: {mode}")
             return False
@@ -881,7 +972,7 @@ class BlackmagicFocusController:
                 self.shutter_measurement_endpoint,
                 json=payload,
                 timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
+                headers=JSON_HEADERS
             )
             
             if self.debug:
@@ -894,11 +985,16 @@ class BlackmagicFocusController:
         except requests.exceptions.RequestException as e:
             if not silent:
                 print(f"Erreur lors de la mise à jour du mode shutter: {e}")
-                if hasattr(e, 'response') and e.response is not None:
-                    print(f"Status code: {e.response.status_code}")
+                error_response = e.response
+                if error_response is not None:
+                    print(f"Status code: {error_response.status_code}")
             return False
     
     def get_supported_shutters(self) -> Optional[dict]:
+        """Retourne les valeurs de shutter supportées (mise en cache CAPABILITY_CACHE_TTL secondes)."""
+        return self._get_cached_capability('supported_shutters', self._fetch_supported_shutters)
+    
+    def _fetch_supported_shutters(self) -> Optional[dict]:
         """
         Récupère les valeurs de shutter supportées.
         
@@ -912,7 +1008,7 @@ class BlackmagicFocusController:
             response = self.session.get(
                 self.supported_shutters_endpoint,
                 timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
+                headers=JSON_HEADERS
             )
             
             if self.debug:
@@ -927,8 +1023,9 @@ class BlackmagicFocusController:
             }
         except requests.exceptions.RequestException as e:
             print(f"Erreur lors de la récupération des shutters supportés: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Status code: {e.response.status_code}")
+            error_response = e.response
+            if error_response is not None:
+                print(f"Status code: {error_response.status_code}")
             return None
     
     def get_shutter(self) -> Optional[dict]:
@@ -946,7 +1043,7 @@ class BlackmagicFocusController:
             response = self.session.get(
                 self.shutter_endpoint,
                 timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
+                headers=JSON_HEADERS
             )
             
             if self.debug:
@@ -962,8 +1059,9 @@ class BlackmagicFocusController:
             }
         except requests.exceptions.RequestException as e:
             print(f"Erreur lors de la récupération du shutter: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Status code: {e.response.status_code}")
+            error_response = e.response
+            if error_response is not None:
+                print(f"Status code: {error_response.status_code}")
             return None
     
     def set_shutter(self, shutter_speed: Optional[int] = None, shutter_angle: Optional[float] = None, silent: bool = False) -> bool:
@@ -998,7 +1096,7 @@ class BlackmagicFocusController:
                 self.shutter_endpoint,
                 json=payload,
                 timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
+                headers=JSON_HEADERS
             )
             
             if self.debug:
@@ -1014,43 +1112,51 @@ class BlackmagicFocusController:
         except requests.exceptions.RequestException as e:
             if not silent:
                 print(f"Erreur lors de la mise à jour du shutter: {e}")
-                if hasattr(e, 'response') and e.response is not None:
-                    status_code = e.response.status_code
+                error_response = e.response
+                if error_response is not None:
+                    status_code = error_response.status_code
                     print(f"Status code: {status_code}")
                     if status_code == 403:
                         print("Le shutter ne peut pas être modifié dans l'état actuel de la caméra")
-                    print(f"Response: {e.response.text}")
+                    print(f"Response: {error_response.text}")
             return False
     
-    def get_zebra(self) -> Optional[bool]:
+    def _get_enabled(self, endpoint: str, label: str) -> Optional[bool]:
         """
-        Récupère l'état actuel du Zebra.
+        Récupère l'état d'un paramètre on/off (Zebra, Focus Assist, False Color, Cleanfeed).
         
+        Args:
+            endpoint: URL du paramètre
+            label: Libellé affiché dans les messages d'erreur
+            
         Returns:
             True si activé, False si désactivé, ou None en cas d'erreur
         """
         try:
             response = self.session.get(
-                self.zebra_endpoint,
+                endpoint,
                 timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
+                headers=JSON_HEADERS
             )
             response.raise_for_status()
             data = response.json()
-            result = data.get('enabled', False)
-            return result
+            return data.get('enabled', False)
         except requests.exceptions.RequestException as e:
             if self.debug:
-                print(f"Erreur lors de la récupération du Zebra: {e}")
+                print(f"Erreur lors de la récupération du {label}: {e}")
             return None
     
-    def set_zebra(self, enabled: bool, silent: bool = False) -> bool:
+    def _set_enabled(self, endpoint: str, label: str, enabled: bool, silent: bool = False,
+                     status_messages: Optional[Dict[int, str]] = None) -> bool:
         """
-        Active ou désactive le Zebra.
+        Active ou désactive un paramètre on/off.
         
         Args:
+            endpoint: URL du paramètre
+            label: Libellé affiché dans les messages
             enabled: True pour activer, False pour désactiver
             silent: Si True, n'affiche pas de message de confirmation
+            status_messages: Messages d'erreur spécifiques par code HTTP (optionnel)
             
         Returns:
             True si la mise à jour a réussi, False sinon
@@ -1058,199 +1164,58 @@ class BlackmagicFocusController:
         try:
             payload = {"enabled": enabled}
             response = self.session.put(
-                self.zebra_endpoint,
+                endpoint,
                 json=payload,
                 timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
+                headers=JSON_HEADERS
             )
-            # Le code 204 (No Content) indique le succès selon la documentation
-            if response.status_code == 204:
-                if not silent:
-                    print(f"Zebra {'activé' if enabled else 'désactivé'}")
-                return True
-            else:
-                # Pour les autres codes de succès (200, etc.)
-                response.raise_for_status()
-                if not silent:
-                    print(f"Zebra {'activé' if enabled else 'désactivé'}")
-                return True
+            # 204 (No Content) indique le succès selon la documentation ; les autres codes
+            # de succès (200, etc.) sont aussi acceptés par raise_for_status
+            response.raise_for_status()
+            if not silent:
+                print(f"{label} {'activé' if enabled else 'désactivé'}")
+            return True
         except requests.exceptions.RequestException as e:
             if not silent:
-                if hasattr(e, 'response') and e.response is not None:
-                    status_code = e.response.status_code
-                    if status_code == 400:
-                        print("Erreur: Entrée invalide (400)")
-                    elif status_code == 422:
-                        print("Erreur: Impossible de traiter les instructions (422)")
-                    else:
-                        print(f"Erreur lors de la mise à jour du Zebra: {e}")
-                else:
-                    print(f"Erreur lors de la mise à jour du Zebra: {e}")
+                error_response = e.response
+                message = None
+                if error_response is not None and status_messages:
+                    message = status_messages.get(error_response.status_code)
+                print(message or f"Erreur lors de la mise à jour du {label}: {e}")
             return False
     
+    def get_zebra(self) -> Optional[bool]:
+        """Récupère l'état actuel du Zebra (None en cas d'erreur)."""
+        return self._get_enabled(self.zebra_endpoint, "Zebra")
+    
+    def set_zebra(self, enabled: bool, silent: bool = False) -> bool:
+        """Active ou désactive le Zebra."""
+        return self._set_enabled(self.zebra_endpoint, "Zebra", enabled, silent, ZEBRA_STATUS_MESSAGES)
+    
     def get_focus_assist(self) -> Optional[bool]:
-        """
-        Récupère l'état actuel du Focus Assist.
-        
-        Returns:
-            True si activé, False si désactivé, ou None en cas d'erreur
-        """
-        try:
-            response = self.session.get(
-                self.focus_assist_endpoint,
-                timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
-            )
-            response.raise_for_status()
-            data = response.json()
-            result = data.get('enabled', False)
-            return result
-        except requests.exceptions.RequestException as e:
-            if self.debug:
-                print(f"Erreur lors de la récupération du Focus Assist: {e}")
-            return None
+        """Récupère l'état actuel du Focus Assist (None en cas d'erreur)."""
+        return self._get_enabled(self.focus_assist_endpoint, "Focus Assist")
     
     def set_focus_assist(self, enabled: bool, silent: bool = False) -> bool:
-        """
-        Active ou désactive le Focus Assist.
-        
-        Args:
-            enabled: True pour activer, False pour désactiver
-            silent: Si True, n'affiche pas de message de confirmation
-            
-        Returns:
-            True si la mise à jour a réussi, False sinon
-        """
-        try:
-            payload = {"enabled": enabled}
-            response = self.session.put(
-                self.focus_assist_endpoint,
-                json=payload,
-                timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
-            )
-            # Le code 204 (No Content) indique le succès selon la documentation
-            if response.status_code == 204:
-                if not silent:
-                    print(f"Focus Assist {'activé' if enabled else 'désactivé'}")
-                return True
-            else:
-                # Pour les autres codes de succès (200, etc.)
-                response.raise_for_status()
-                if not silent:
-                    print(f"Focus Assist {'activé' if enabled else 'désactivé'}")
-                return True
-        except requests.exceptions.RequestException as e:
-            if not silent:
-                if hasattr(e, 'response') and e.response is not None:
-                    status_code = e.response.status_code
-                    if status_code == 400:
-                        print("Erreur: Entrée invalide ou configuration invalide (400)")
-                    elif status_code == 422:
-                        print("Erreur: Impossible de traiter les instructions (422)")
-                    else:
-                        print(f"Erreur lors de la mise à jour du Focus Assist: {e}")
-                else:
-                    print(f"Erreur lors de la mise à jour du Focus Assist: {e}")
-            return False
+        """Active ou désactive le Focus Assist."""
+        return self._set_enabled(self.focus_assist_endpoint, "Focus Assist", enabled, silent,
+                                 FOCUS_ASSIST_STATUS_MESSAGES)
     
     def get_false_color(self) -> Optional[bool]:
-        """
-        Récupère l'état actuel du False Color.
-        
-        Returns:
-            True si activé, False si désactivé, ou None en cas d'erreur
-        """
-        try:
-            response = self.session.get(
-                self.false_color_endpoint,
-                timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get('enabled', False)
-        except requests.exceptions.RequestException as e:
-            if self.debug:
-                print(f"Erreur lors de la récupération du False Color: {e}")
-            return None
+        """Récupère l'état actuel du False Color (None en cas d'erreur)."""
+        return self._get_enabled(self.false_color_endpoint, "False Color")
     
     def set_false_color(self, enabled: bool, silent: bool = False) -> bool:
-        """
-        Active ou désactive le False Color.
-        
-        Args:
-            enabled: True pour activer, False pour désactiver
-            silent: Si True, n'affiche pas de message de confirmation
-            
-        Returns:
-            True si la mise à jour a réussi, False sinon
-        """
-        try:
-            payload = {"enabled": enabled}
-            response = self.session.put(
-                self.false_color_endpoint,
-                json=payload,
-                timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
-            )
-            response.raise_for_status()
-            if not silent:
-                print(f"False Color {'activé' if enabled else 'désactivé'}")
-            return True
-        except requests.exceptions.RequestException as e:
-            if not silent:
-                print(f"Erreur lors de la mise à jour du False Color: {e}")
-            return False
+        """Active ou désactive le False Color."""
+        return self._set_enabled(self.false_color_endpoint, "False Color", enabled, silent)
     
     def get_cleanfeed(self) -> Optional[bool]:
-        """
-        Récupère l'état actuel du Cleanfeed.
-        
-        Returns:
-            True si activé, False si désactivé, ou None en cas d'erreur
-        """
-        try:
-            response = self.session.get(
-                self.cleanfeed_endpoint,
-                timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get('enabled', False)
-        except requests.exceptions.RequestException as e:
-            if self.debug:
-                print(f"Erreur lors de la récupération du Cleanfeed: {e}")
-            return None
+        """Récupère l'état actuel du Cleanfeed (None en cas d'erreur)."""
+        return self._get_enabled(self.cleanfeed_endpoint, "Cleanfeed")
     
     def set_cleanfeed(self, enabled: bool, silent: bool = False) -> bool:
-        """
-        Active ou désactive le Cleanfeed.
-        
-        Args:
-            enabled: True pour activer, False pour désactiver
-            silent: Si True, n'affiche pas de message de confirmation
-            
-        Returns:
-            True si la mise à jour a réussi, False sinon
-        """
-        try:
-            payload = {"enabled": enabled}
-            response = self.session.put(
-                self.cleanfeed_endpoint,
-                json=payload,
-                timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
-            )
-            response.raise_for_status()
-            if not silent:
-                print(f"Cleanfeed {'activé' if enabled else 'désactivé'}")
-            return True
-        except requests.exceptions.RequestException as e:
-            if not silent:
-                print(f"Erreur lors de la mise à jour du Cleanfeed: {e}")
-            return False
+        """Active ou désactive le Cleanfeed."""
+        return self._set_enabled(self.cleanfeed_endpoint, "Cleanfeed", enabled, silent)
     
     def do_autofocus(self, x: float = 0.5, y: float = 0.5, silent: bool = False) -> bool:
         """
@@ -1284,7 +1249,7 @@ class BlackmagicFocusController:
                 self.autofocus_endpoint,
                 json=payload,
                 timeout=10,
-                headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
+                headers=JSON_HEADERS
             )
             
             if self.debug or not silent:
@@ -1292,7 +1257,7 @@ class BlackmagicFocusController:
                 print(f"[DEBUG] Response: {response.text}")
             
             # L'API peut retourner 204 (No Content) ou 200 pour indiquer le succès
-            if response.status_code in [200, 204]:
+            if response.status_code in (200, 204):
                 if not silent:
                     print(f"Autofocus déclenché à la position ({x:.2f}, {y:.2f})")
                 return True
@@ -1320,9 +1285,10 @@ class BlackmagicFocusController:
         except requests.exceptions.RequestException as e:
             error_msg = f"Erreur lors du déclenchement de l'autofocus: {e}"
             logging.error(error_msg)
-            if hasattr(e, 'response') and e.response is not None:
-                status_code = e.response.status_code
-                response_text = e.response.text
+            error_response = e.response
+            if error_response is not None:
+                status_code = error_response.status_code
+                response_text = error_response.text
                 logging.error(f"Status code: {status_code}, Response: {response_text}")
                 if not silent:
                     print(error_msg)
@@ -1341,18 +1307,29 @@ class BlackmagicFocusController:
     
     def _polling_loop(self):
         """Boucle de polling qui s'exécute dans un thread séparé."""
+        last_state = None
+        # Références locales : évitent les résolutions d'attributs à chaque itération
+        get_focus = self.get_focus
+        wait_for_stop = self.polling_stop_event.wait
+        interval = 1.0 / self.polling_frequency  # Fixée par start_polling avant le démarrage
         while self.polling_active:
-            value = self.get_focus()
-            if value is not None:
-                # Afficher sur une seule ligne avec retour chariot pour éviter le spam
-                if self.target_value is not None:
-                    print(f"\r[Polling] Focus actuel: {value:.6f} | Cible: {self.target_value:.6f}", end='', flush=True)
+            value = get_focus()
+            # Un seul test combiné : ne rien réafficher si ni la valeur ni la cible n'ont changé
+            state = (value, self.target_value)
+            if state != last_state:
+                last_state = state
+                if value is not None:
+                    # Afficher sur une seule ligne avec retour chariot pour éviter le spam
+                    if self.target_value is not None:
+                        print(f"\r[Polling] Focus actuel: {value:.6f} | Cible: {self.target_value:.6f}", end='', flush=True)
+                    else:
+                        print(f"\r[Polling] Focus actuel: {value:.6f}", end='', flush=True)
                 else:
-                    print(f"\r[Polling] Focus actuel: {value:.6f}", end='', flush=True)
-            else:
-                print("\r[Polling] Erreur lors de la récupération", end='', flush=True)
+                    print("\r[Polling] Erreur lors de la récupération", end='', flush=True)
             
-            time.sleep(1.0 / self.polling_frequency)
+            # Attente interrompue dès que stop_polling est appelé
+            if wait_for_stop(interval):
+                break
     
     def start_polling(self, frequency: float = DEFAULT_POLLING_FREQUENCY):
         """
@@ -1367,6 +1344,7 @@ class BlackmagicFocusController:
         
         self.polling_frequency = frequency
         self.polling_active = True
+        self.polling_stop_event.clear()
         self.polling_thread = threading.Thread(target=self._polling_loop, daemon=True)
         self.polling_thread.start()
         print(f"Polling démarré à {frequency} Hz")
@@ -1378,6 +1356,7 @@ class BlackmagicFocusController:
             return
         
         self.polling_active = False
+        self.polling_stop_event.set()
         if self.polling_thread:
             self.polling_thread.join(timeout=2)
         print("Polling arrêté")
@@ -1389,16 +1368,16 @@ class BlackmagicFocusController:
         Returns:
             La valeur cible ou None si le fichier n'existe pas ou est invalide
         """
-        if not os.path.exists(CONFIG_FILE):
-            return None
-        
         try:
             with open(CONFIG_FILE, 'r') as f:
                 config = json.load(f)
                 target = config.get("target_focus")
                 if target is not None:
                     self.target_value = float(target)
+                    self.last_saved_target = self.target_value
                     return self.target_value
+        except FileNotFoundError:
+            return None
         except (json.JSONDecodeError, ValueError, KeyError) as e:
             print(f"Erreur lors du chargement de la configuration: {e}")
         
@@ -1411,14 +1390,32 @@ class BlackmagicFocusController:
         Args:
             value: Valeur à sauvegarder
         """
+        # Éviter une écriture disque inutile si la valeur persistée est identique. La valeur
+        # mémorisée n'est fiable que si le fichier n'a pas été modifié depuis (mtime inchangé)
+        if value == self.last_saved_target:
+            try:
+                file_unchanged = os.path.getmtime(CONFIG_FILE) == self.last_config_mtime
+            except OSError:
+                file_unchanged = False
+            if file_unchanged:
+                print(f"\nValeur cible inchangée dans {CONFIG_FILE}: {value}")
+                return
         config = {"target_focus": value}
+        # Écriture dans un fichier temporaire puis remplacement atomique : la surveillance
+        # du fichier (ou un autre processus) ne lit jamais un fichier à moitié écrit
+        tmp_file = CONFIG_FILE + ".tmp"
         try:
-            with open(CONFIG_FILE, 'w') as f:
+            with open(tmp_file, 'w') as f:
                 json.dump(config, f, indent=2)
+            os.replace(tmp_file, CONFIG_FILE)
             # Mettre à jour le timestamp pour éviter de recharger immédiatement
             self.last_config_mtime = os.path.getmtime(CONFIG_FILE)
+            self.last_saved_target = value
             print(f"\nValeur cible sauvegardée dans {CONFIG_FILE}: {value}")
         except Exception as e:
+            # Ne pas laisser de fichier temporaire orphelin (disque plein, droits...)
+            with suppress(OSError):
+                os.remove(tmp_file)
             print(f"\nErreur lors de la sauvegarde de la configuration: {e}")
     
     def sweep_focus(self, start: float = 0.0, end: float = 1.0, steps: int = 100, delay: float = None, infinite: bool = False, duration: float = None):
@@ -1445,6 +1442,11 @@ class BlackmagicFocusController:
         # Calculer la fréquence d'affichage (afficher toutes les N étapes pour ne pas saturer)
         display_interval = max(1, steps // 50)  # Afficher environ 50 fois par cycle
         
+        # Précalculer les valeurs des deux directions (interpolation linéaire) une seule fois,
+        # elles sont réutilisées à chaque cycle en mode infini
+        forward_values = [start + (end - start) * (i / steps) for i in range(steps + 1)]
+        backward_values = [end - (end - start) * (i / steps) for i in range(steps + 1)]
+        
         if infinite:
             print(f"\n[Sweep] Démarrage du balayage infini (allers-retours) de {start:.3f} à {end:.3f}")
             if duration is not None:
@@ -1461,39 +1463,47 @@ class BlackmagicFocusController:
                 print(f"[Sweep] Durée totale estimée: {steps * delay:.1f}s")
             print()
         
+        # Références locales pour la boucle de balayage
+        set_focus = self.set_focus
+        sleep = time.sleep
+        monotonic = time.monotonic
+        
         try:
             cycle = 0
             forward = True
+            # Échéance de l'étape suivante sur l'horloge monotone : la latence de set_focus
+            # est absorbée par l'attente au lieu de s'ajouter au délai de chaque étape
+            next_step_time = monotonic()
             
             while True:
                 if infinite:
                     direction = "→" if forward else "←"
                     print(f"[Sweep] Cycle {cycle + 1} - Direction: {direction}")
                 
-                for i in range(steps + 1):
-                    # Calculer la valeur actuelle (interpolation linéaire)
-                    progress = i / steps
-                    
-                    if forward:
-                        current_value = start + (end - start) * progress
-                    else:
-                        current_value = end - (end - start) * progress
-                    
+                for i, current_value in enumerate(forward_values if forward else backward_values):
                     # Appliquer la valeur (mode silencieux pour laisser le polling s'afficher)
-                    if not self.set_focus(current_value, silent=True):
+                    if not set_focus(current_value, silent=True):
                         print(f"\n[Sweep] Erreur à l'étape {i}/{steps}")
                         return False
                     
                     # Afficher périodiquement (pas à chaque étape pour ne pas saturer)
                     if i % display_interval == 0 or i == steps:
+                        progress = i / steps
                         if infinite:
                             print(f"[Sweep] Cycle {cycle + 1} {direction} - Étape {i}/{steps} ({progress*100:.1f}%)")
                         else:
                             print(f"[Sweep] Étape {i}/{steps} ({progress*100:.1f}%)")
                     
-                    # Attendre avant la prochaine étape (sauf pour la dernière)
+                    # Attendre la prochaine échéance (sauf pour la dernière étape)
                     if i < steps:
-                        time.sleep(delay)
+                        next_step_time += delay
+                        remaining = next_step_time - monotonic()
+                        if remaining > 0:
+                            sleep(remaining)
+                        elif remaining < -delay:
+                            # Caméra trop lente pour la cadence demandée : repartir de maintenant
+                            # plutôt que d'enchaîner les étapes en retard sans pause
+                            next_step_time = monotonic()
                 
                 if not infinite:
                     break
@@ -1518,20 +1528,38 @@ class BlackmagicFocusController:
     
     def _config_watch_loop(self):
         """Surveille le fichier de configuration et applique les changements automatiquement."""
+        pending_mtime = None
         while self.config_watch_active:
             try:
-                if os.path.exists(CONFIG_FILE):
+                # Un seul appel système : getmtime échoue si le fichier n'existe pas
+                try:
                     current_mtime = os.path.getmtime(CONFIG_FILE)
-                    if current_mtime != self.last_config_mtime:
+                except FileNotFoundError:
+                    current_mtime = None
+                if current_mtime is not None:
+                    if current_mtime == self.last_config_mtime:
+                        pending_mtime = None
+                    elif current_mtime != pending_mtime:
+                        # Attendre un cycle sans modification pour regrouper les écritures rapprochées
+                        pending_mtime = current_mtime
+                    else:
+                        pending_mtime = None
                         self.last_config_mtime = current_mtime
+                        previous_target = self.last_saved_target
                         target = self.load_target_from_config()
-                        if target is not None:
+                        # Fichier réécrit sans changer la cible (ex: sauvegarde dans l'éditeur) :
+                        # ne pas renvoyer la même valeur à la caméra. La comparaison porte sur la
+                        # dernière valeur lue/écrite dans le fichier, pas sur le dernier focus envoyé
+                        if target is not None and target != previous_target:
                             print(f"\n[Config] Nouvelle valeur détectée: {target}")
                             self.set_focus(target)
-                time.sleep(0.5)  # Vérifier toutes les 0.5 secondes
+                # Vérifier toutes les 0.5 secondes (attente interrompue par stop_config_watch)
+                if self.config_watch_stop_event.wait(0.5):
+                    break
             except Exception as e:
                 print(f"\n[Config] Erreur lors de la surveillance: {e}")
-                time.sleep(1)
+                if self.config_watch_stop_event.wait(1):
+                    break
     
     def start_config_watch(self):
         """Démarre la surveillance du fichier de configuration."""
@@ -1539,8 +1567,11 @@ class BlackmagicFocusController:
             return
         
         self.config_watch_active = True
-        if os.path.exists(CONFIG_FILE):
+        self.config_watch_stop_event.clear()
+        try:
             self.last_config_mtime = os.path.getmtime(CONFIG_FILE)
+        except FileNotFoundError:
+            pass
         self.config_watch_thread = threading.Thread(target=self._config_watch_loop, daemon=True)
         self.config_watch_thread.start()
         print("Surveillance du fichier de configuration activée")
@@ -1548,27 +1579,14 @@ class BlackmagicFocusController:
     def stop_config_watch(self):
         """Arrête la surveillance du fichier de configuration."""
         self.config_watch_active = False
+        self.config_watch_stop_event.set()
         if self.config_watch_thread:
             self.config_watch_thread.join(timeout=1)
     
     def interactive_mode_loop(self):
         """Boucle interactive permettant de changer le focus en temps réel."""
-        print("\n" + "="*60)
-        print("Mode interactif activé")
-        print("="*60)
-        print("Commandes disponibles:")
-        print("  <valeur>          - Définir le focus (ex: 0.5)")
-        print("  get               - Lire la valeur actuelle")
-        print("  save <valeur>     - Définir et sauvegarder dans la config")
-        print("  sweep             - Balayer le focus de 0 à 1 progressivement")
-        print("  sweep <start> <end> <steps> <delay> - Balayer de start à end")
-        print("  sweep infinite    - Balayer en allers-retours à l'infini")
-        print("  sweep <start> <end> <steps> <delay> infinite - Balayer infini personnalisé")
-        print("  watch             - Activer la surveillance du fichier config")
-        print("  unwatch           - Désactiver la surveillance du fichier config")
-        print("  help              - Afficher cette aide")
-        print("  quit / exit       - Quitter")
-        print("="*60 + "\n")
+        print(f"\n{'='*60}\nMode interactif activé\n{'='*60}\n"
+              f"Commandes disponibles:\n{INTERACTIVE_COMMANDS_HELP}\n{'='*60}\n")
         
         while True:
             try:
@@ -1579,45 +1597,38 @@ class BlackmagicFocusController:
                 if not user_input:
                     continue
                 
+                # Normaliser la commande une seule fois pour tous les tests ci-dessous
+                command = user_input.lower()
+                
                 # Quitter
-                if user_input.lower() in ['quit', 'exit', 'q']:
+                if command in QUIT_COMMANDS:
                     print("\nArrêt du mode interactif...")
                     break
                 
                 # Aide
-                if user_input.lower() == 'help':
-                    print("\nCommandes:")
-                    print("  <valeur>          - Définir le focus (ex: 0.5)")
-                    print("  get               - Lire la valeur actuelle")
-                    print("  save <valeur>     - Définir et sauvegarder dans la config")
-                    print("  sweep             - Balayer le focus de 0 à 1 progressivement")
-                    print("  sweep <start> <end> <steps> <delay> - Balayer de start à end")
-                    print("  sweep infinite    - Balayer en allers-retours à l'infini")
-                    print("  watch             - Activer la surveillance du fichier config")
-                    print("  unwatch           - Désactiver la surveillance du fichier config")
-                    print("  help              - Afficher cette aide")
-                    print("  quit / exit       - Quitter")
+                if command == 'help':
+                    print(f"\nCommandes:\n{INTERACTIVE_COMMANDS_HELP}")
                     continue
                 
                 # Lire la valeur actuelle
-                if user_input.lower() == 'get':
+                if command == 'get':
                     value = self.get_focus()
                     if value is not None:
                         print(f"\nValeur actuelle du focus: {value:.6f}")
                     continue
                 
                 # Surveiller le fichier config
-                if user_input.lower() == 'watch':
+                if command == 'watch':
                     self.start_config_watch()
                     continue
                 
-                if user_input.lower() == 'unwatch':
+                if command == 'unwatch':
                     self.stop_config_watch()
                     print("\nSurveillance du fichier config désactivée")
                     continue
                 
                 # Sauvegarder dans la config
-                if user_input.lower().startswith('save '):
+                if command.startswith('save '):
                     try:
                         value = float(user_input.split()[1])
                         self.set_focus(value)
@@ -1627,11 +1638,11 @@ class BlackmagicFocusController:
                     continue
                 
                 # Balayer le focus
-                if user_input.lower().startswith('sweep'):
+                if command.startswith('sweep'):
                     parts = user_input.split()
                     try:
                         # Vérifier si mode infini
-                        infinite = 'infinite' in user_input.lower() or 'inf' in user_input.lower()
+                        infinite = 'infinite' in command or 'inf' in command
                         
                         if len(parts) == 1:
                             # Sweep par défaut: 0 à 1, 100 étapes, 0.1s de délai
@@ -1803,7 +1814,6 @@ Exemples:
     args = parser.parse_args()
     
     # Désactiver les avertissements SSL pour les certificats auto-signés
-    import urllib3
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
     
     # Créer le contrôleur
@@ -1830,68 +1840,65 @@ Exemples:
             print(f"Valeur actuelle du focus: {value:.6f}")
     
     # Balayer le focus si demandé
+    polling_started_for_sweep = False
     if args.sweep is not None:
         # Démarrer le polling automatiquement pour voir la valeur en temps réel pendant le sweep
         if not args.polling and not args.interactive:
             controller.start_polling(args.frequency)
             polling_started_for_sweep = True
-        else:
-            polling_started_for_sweep = False
-        if args.sweep == 'default':
-            # Sweep par défaut: 0 à 1, 100 étapes
-            if args.duration:
-                controller.sweep_focus(0.0, 1.0, 100, duration=args.duration, infinite=args.infinite)
-            else:
-                controller.sweep_focus(0.0, 1.0, 100, 0.1, infinite=args.infinite)
-        else:
-            # Parser la configuration: start,end,steps,delay ou start,end,steps (avec --duration)
-            try:
-                parts = args.sweep.split(',')
+        # try/finally : le polling démarré pour le sweep est arrêté quelle que soit l'issue
+        try:
+            if args.sweep == 'default':
+                # Sweep par défaut: 0 à 1, 100 étapes
                 if args.duration:
-                    # Si --duration est spécifié, on peut avoir 3 ou 4 paramètres
-                    if len(parts) == 3:
-                        start = float(parts[0])
-                        end = float(parts[1])
-                        steps = int(parts[2])
-                        controller.sweep_focus(start, end, steps, duration=args.duration, infinite=args.infinite)
+                    controller.sweep_focus(0.0, 1.0, 100, duration=args.duration, infinite=args.infinite)
+                else:
+                    controller.sweep_focus(0.0, 1.0, 100, 0.1, infinite=args.infinite)
+            else:
+                # Parser la configuration: start,end,steps,delay ou start,end,steps (avec --duration)
+                try:
+                    parts = args.sweep.split(',')
+                    if args.duration:
+                        # Si --duration est spécifié, on peut avoir 3 ou 4 paramètres
+                        if len(parts) == 3:
+                            start = float(parts[0])
+                            end = float(parts[1])
+                            steps = int(parts[2])
+                            controller.sweep_focus(start, end, steps, duration=args.duration, infinite=args.infinite)
+                        elif len(parts) == 4:
+                            # On ignore le 4ème paramètre si --duration est spécifié
+                            start = float(parts[0])
+                            end = float(parts[1])
+                            steps = int(parts[2])
+                            controller.sweep_focus(start, end, steps, duration=args.duration, infinite=args.infinite)
+                        else:
+                            print("Erreur: Format invalide. Utilisez: --sweep start,end,steps --duration SECONDS")
+                            print("Exemple: --sweep 0,1,512 --duration 5.0")
                     elif len(parts) == 4:
-                        # On ignore le 4ème paramètre si --duration est spécifié
+                        # Format classique: start,end,steps,delay
                         start = float(parts[0])
                         end = float(parts[1])
                         steps = int(parts[2])
-                        controller.sweep_focus(start, end, steps, duration=args.duration, infinite=args.infinite)
+                        delay = float(parts[3])
+                        controller.sweep_focus(start, end, steps, delay=delay, infinite=args.infinite)
                     else:
-                        print("Erreur: Format invalide. Utilisez: --sweep start,end,steps --duration SECONDS")
-                        print("Exemple: --sweep 0,1,512 --duration 5.0")
-                elif len(parts) == 4:
-                    # Format classique: start,end,steps,delay
-                    start = float(parts[0])
-                    end = float(parts[1])
-                    steps = int(parts[2])
-                    delay = float(parts[3])
-                    controller.sweep_focus(start, end, steps, delay=delay, infinite=args.infinite)
-                else:
-                    print("Erreur: Format invalide. Utilisez: --sweep start,end,steps,delay")
-                    print("Exemple: --sweep 0,1,100,0.1")
-                    print("Ou utilisez --duration pour spécifier la durée totale: --sweep 0,1,512 --duration 5.0")
-                    print("Ajoutez --infinite pour les allers-retours à l'infini")
-            except (ValueError, IndexError) as e:
-                print(f"Erreur lors du parsing de la configuration sweep: {e}")
-                print("Format attendu: start,end,steps,delay ou start,end,steps avec --duration")
-        
-        # Gérer le polling après le sweep
-        if polling_started_for_sweep:
-            if args.infinite:
-                # Pour le mode infini, maintenir le script en vie jusqu'à Ctrl+C
+                        print("Erreur: Format invalide. Utilisez: --sweep start,end,steps,delay")
+                        print("Exemple: --sweep 0,1,100,0.1")
+                        print("Ou utilisez --duration pour spécifier la durée totale: --sweep 0,1,512 --duration 5.0")
+                        print("Ajoutez --infinite pour les allers-retours à l'infini")
+                except (ValueError, IndexError) as e:
+                    print(f"Erreur lors du parsing de la configuration sweep: {e}")
+                    print("Format attendu: start,end,steps,delay ou start,end,steps avec --duration")
+            
+            # Pour le mode infini, maintenir le script en vie jusqu'à Ctrl+C
+            if polling_started_for_sweep and args.infinite:
                 try:
                     while controller.polling_active:
                         time.sleep(1)
                 except KeyboardInterrupt:
                     pass
-                finally:
-                    controller.stop_polling()
-            else:
-                # Pour le mode non-infini, arrêter le polling après le sweep
+        finally:
+            if polling_started_for_sweep:
                 controller.stop_polling()
     
     # Démarrer la surveillance du fichier config si demandé
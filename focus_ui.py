@@ -9,17 +9,124 @@ from flask_socketio import SocketIO, emit
 import threading
 import time
 import queue
-from blackmagic_focus_control import BlackmagicFocusController, BlackmagicWebSocketClient
+import json
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from blackmagic_focus_control import BlackmagicFocusController, BlackmagicWebSocketClient, SHUTTER_MEASUREMENT_MODES
 import argparse
+import atexit
 import logging
+import traceback
+import urllib3
+
+try:
+    import orjson  # Optionnel : sérialisation plus rapide du journal de debug
+except ImportError:
+    orjson = None
 
 app = Flask(__name__)
 socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading', ping_timeout=60, ping_interval=25)
 controller = None
 websocket_client = None
 event_queue = queue.Queue()
+rendered_index = None  # Page principale rendue une seule fois (template statique)
+# Dernière valeur émise par type de paramètre (pour filtrer les variations négligeables)
+last_emitted_values = {}
+last_websocket_status = None  # Dernier état (connecté, message) du WebSocket caméra diffusé
+# Précision d'affichage des valeurs normalisées (3 décimales, résolution des sliders: 0.001)
+NORMALISED_DISPLAY_DECIMALS = 3
 logging.basicConfig(level=logging.INFO)
 
+# Journal de debug (agent log) : désactivé par défaut, activable avec FOCUS_DEBUG_LOG=1
+DEBUG_LOG = os.environ.get('FOCUS_DEBUG_LOG') == '1'
+# Chemin du journal : FOCUS_DEBUG_LOG_PATH, sinon debug.log à côté du script
+DEBUG_LOG_PATH = os.environ.get('FOCUS_DEBUG_LOG_PATH') or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'debug.log')
+DEBUG_LOG_FLUSH_INTERVAL = 1.0  # secondes
+DEBUG_LOG_FLUSH_THRESHOLD = 256  # Entrées en attente déclenchant un vidage anticipé
+# Champs identiques pour toutes les entrées, sérialisés une fois pour toutes
+DEBUG_LOG_STATIC_FIELDS = b',"sessionId":"debug-session","runId":"start-sh-debug"}'
+# Tampon borné : si le disque ne suit pas, les entrées les plus anciennes sont perdues
+debug_log_buffer = deque(maxlen=10000)
+debug_log_fd = None  # Descripteur ouvert au premier vidage puis conservé
+debug_log_lock = threading.Lock()  # Sérialise les vidages (thread de fond / main)
+debug_log_wakeup = threading.Event()  # Réveille le thread de vidage quand le tampon se remplit
+
+
+def debug_log(location: str, message: str, data_factory, hypothesis_id: str):
+    """
+    Ajoute une entrée au journal de debug.
+    
+    Args:
+        location: Emplacement dans le code (ex: 'focus_ui.py:main:start')
+        message: Description de l'événement
+        data_factory: Fonction sans argument retournant le dict 'data' ; elle n'est
+                      appelée que si le journal est actif
+        hypothesis_id: Identifiant de l'hypothèse de debug
+    """
+    if not DEBUG_LOG:
+        return
+    # Seules les données sont capturées ici ; la mise en forme est faite par le thread de vidage
+    debug_log_buffer.append((location, message, data_factory(), time.time_ns() // 1_000_000, hypothesis_id))
+    # Le thread de vidage n'est réveillé qu'au seuil ; sinon il vide à son intervalle
+    if len(debug_log_buffer) >= DEBUG_LOG_FLUSH_THRESHOLD and not debug_log_wakeup.is_set():
+        debug_log_wakeup.set()
+
+
+def serialize_debug_entry(entry: tuple) -> bytes:
+    """Sérialise une entrée du journal de debug en JSON (orjson si disponible)."""
+    location, message, data, timestamp, hypothesis_id = entry
+    record = {
+        'location': location,
+        'message': message,
+        'data': data,
+        'timestamp': timestamp,
+        'hypothesisId': hypothesis_id,
+    }
+    if orjson is not None:
+        encoded = orjson.dumps(record)
+    else:
+        encoded = json.dumps(record, separators=(',', ':')).encode('utf-8')
+    # Remplacer l'accolade fermante par les champs constants déjà sérialisés
+    return encoded[:-1] + DEBUG_LOG_STATIC_FIELDS
+
+
+def flush_debug_log():
+    """Écrit sur disque, en un seul appel système, les entrées du journal de debug en attente."""
+    global debug_log_fd
+    with debug_log_lock:
+        lines = []
+        while True:
+            try:
+                entry = debug_log_buffer.popleft()
+            except IndexError:
+                break
+            lines.append(serialize_debug_entry(entry))
+        if not lines:
+            return
+        lines.append(b'')  # Retour à la ligne final
+        try:
+            if debug_log_fd is None:
+                os.makedirs(os.path.dirname(os.path.abspath(DEBUG_LOG_PATH)), exist_ok=True)
+                debug_log_fd = os.open(DEBUG_LOG_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            payload = memoryview(b'\n'.join(lines))
+            while payload:
+                written = os.write(debug_log_fd, payload)
+                payload = payload[written:]
+        except OSError as e:
+            logging.debug(f"Impossible d'écrire le journal de debug: {e}")
+
+
+def debug_log_flush_loop():
+    """Boucle de vidage du journal de debug (thread daemon), périodique ou réveillée au seuil."""
+    while True:
+        # Les entrées arrivées pendant un vidage sont regroupées dans l'écriture suivante
+        debug_log_wakeup.wait(DEBUG_LOG_FLUSH_INTERVAL)
+        debug_log_wakeup.clear()
+        flush_debug_log()
+
 # Template HTML avec slider vertical
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -80,7 +187,8 @@ HTML_TEMPLATE = """
             flex-direction: column;
         }
         
-        .iris-display {
+        /* Styles partagés par les blocs d'affichage focus-* et iris-* */
+        .focus-display, .iris-display {
             text-align: center;
             margin-bottom: 30px;
             min-height: 120px;
@@ -89,7 +197,7 @@ HTML_TEMPLATE = """
             justify-content: flex-start;
         }
         
-        .iris-value-sent {
+        .focus-value-sent, .iris-value-sent {
             font-size: 24px;
             font-weight: bold;
             color: #ff0;
@@ -97,7 +205,7 @@ HTML_TEMPLATE = """
             font-family: 'Courier New', monospace;
         }
         
-        .iris-value-actual {
+        .focus-value-actual, .iris-value-actual {
             font-size: 24px;
             font-weight: bold;
             color: #0ff;
@@ -105,7 +213,7 @@ HTML_TEMPLATE = """
             font-family: 'Courier New', monospace;
         }
         
-        .iris-label {
+        .focus-label, .iris-label {
             font-size: 12px;
             color: #aaa;
             text-transform: uppercase;
@@ -126,15 +234,6 @@ HTML_TEMPLATE = """
             font-weight: normal;
         }
         
-        .focus-display {
-            text-align: center;
-            margin-bottom: 30px;
-            min-height: 120px;
-            display: flex;
-            flex-direction: column;
-            justify-content: flex-start;
-        }
-        
         .focus-value {
             font-size: 36px;
             font-weight: bold;
@@ -143,29 +242,6 @@ HTML_TEMPLATE = """
             font-family: 'Courier New', monospace;
         }
         
-        .focus-value-sent {
-            font-size: 24px;
-            font-weight: bold;
-            color: #ff0;
-            margin-bottom: 3px;
-            font-family: 'Courier New', monospace;
-        }
-        
-        .focus-value-actual {
-            font-size: 24px;
-            font-weight: bold;
-            color: #0ff;
-            margin-bottom: 5px;
-            font-family: 'Courier New', monospace;
-        }
-        
-        .focus-label {
-            font-size: 12px;
-            color: #aaa;
-            text-transform: uppercase;
-            margin-bottom: 10px;
-        }
-        
         .value-row {
             display: flex;
             justify-content: space-around;
@@ -182,7 +258,8 @@ HTML_TEMPLATE = """
             margin-bottom: 3px;
         }
         
-        .slider-container {
+        /* Conteneurs et graduations des sliders : règles communes, puis variante gain (plus courte) */
+        .slider-container, .slider-container-gain {
             display: flex;
             justify-content: center;
             align-items: stretch;
@@ -192,28 +269,28 @@ HTML_TEMPLATE = """
         }
         
         .slider-container-gain {
-            display: flex;
-            justify-content: center;
-            align-items: stretch;
             height: 320px;
-            margin: 20px 0;
-            flex-shrink: 0;
         }
         
-        .slider-labels-gain {
+        .slider-labels, .slider-labels-gain {
             display: flex;
             flex-direction: column;
             align-items: center;
             margin-top: 10px;
             font-size: 11px;
             color: #aaa;
-            height: 300px;
+            height: 480px;
             justify-content: space-between;
             position: absolute;
-            left: 70px;
+            left: 90px;
             top: 0;
         }
         
+        .slider-labels-gain {
+            height: 300px;
+            left: 70px;
+        }
+        
         .slider-row {
             display: flex;
             align-items: center;
@@ -241,6 +318,11 @@ HTML_TEMPLATE = """
             top: 210px;
         }
         
+        /* Sliders courts (iris, gain) : même rotation, recentrés dans leur conteneur */
+        .slider-container-gain input[type="range"] {
+            top: 120px;
+        }
+        
         input[type="range"]::-webkit-slider-track {
             width: 480px;
             height: 10px;
@@ -282,20 +364,6 @@ HTML_TEMPLATE = """
             cursor: pointer;
         }
         
-        .slider-labels {
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            margin-top: 10px;
-            font-size: 11px;
-            color: #aaa;
-            height: 480px;
-            justify-content: space-between;
-            position: absolute;
-            left: 90px;
-            top: 0;
-        }
-        
         .status {
             text-align: center;
             margin-top: 15px;
@@ -379,7 +447,7 @@ HTML_TEMPLATE = """
             display: flex;
             align-items: center;
             justify-content: center;
-            transition: all 0.2s;
+            transition: background-color 0.2s, border-color 0.2s, transform 0.2s;
         }
         
         .control-button:hover {
@@ -397,6 +465,17 @@ HTML_TEMPLATE = """
             cursor: not-allowed;
         }
         
+        /* Panneau Contrôles : boutons sur toute la largeur */
+        .control-buttons.stretched {
+            align-items: stretch;
+            margin: 20px 0;
+        }
+        
+        .control-button.autofocus-button {
+            width: 100%;
+            margin-top: 10px;
+        }
+        
         .toggle-button {
             width: 100%;
             padding: 20px;
@@ -405,8 +484,9 @@ HTML_TEMPLATE = """
             border: 2px solid #555;
             border-radius: 8px;
             cursor: pointer;
-            transition: all 0.3s ease;
+            transition: background-color 0.3s ease, color 0.3s ease, border-color 0.3s ease, opacity 0.3s ease, transform 0.3s ease;
             text-align: center;
+            /* État OFF (classe .disabled) : style de base, seul .enabled le surcharge */
             background: #2a2a2a;
             color: #aaa;
         }
@@ -417,12 +497,6 @@ HTML_TEMPLATE = """
             border-color: #0f0;
         }
         
-        .toggle-button.disabled {
-            background: #2a2a2a;
-            color: #aaa;
-            border-color: #555;
-        }
-        
         .toggle-button:hover {
             opacity: 0.8;
         }
@@ -477,11 +551,6 @@ HTML_TEMPLATE = """
                     max="1" 
                     step="0.001" 
                     value="0"
-                    oninput="updateFocus(this.value)"
-                    onmousedown="onSliderTouch()"
-                    onmouseup="onSliderRelease()"
-                    ontouchstart="onSliderTouch()"
-                    ontouchend="onSliderRelease()"
                 >
                 <div class="slider-labels">
                     <span>1.0</span>
@@ -502,7 +571,7 @@ HTML_TEMPLATE = """
             <div class="value-row">
                 <div class="value-item">
                     <div class="value-item-label">Réel (GET)</div>
-                    <div class="focus-value-actual" id="irisApertureStop" style="font-size: 24px;">-</div>
+                    <div class="focus-value-actual" id="irisApertureStop">-</div>
                 </div>
             </div>
         </div>
@@ -517,12 +586,6 @@ HTML_TEMPLATE = """
                     max="100" 
                     step="0.1" 
                     value="0"
-                    oninput="updateIris(this.value)"
-                    onmousedown="onIrisSliderTouch()"
-                    onmouseup="onIrisSliderRelease()"
-                    ontouchstart="onIrisSliderTouch()"
-                    ontouchend="onIrisSliderRelease()"
-                    style="top: 120px;"
                 >
                 <div class="slider-labels-gain">
                     <span id="irisMaxLabel">-</span>
@@ -562,12 +625,6 @@ HTML_TEMPLATE = """
                     max="100" 
                     step="1" 
                     value="0"
-                    oninput="updateGain(this.value)"
-                    onmousedown="onGainSliderTouch()"
-                    onmouseup="onGainSliderRelease()"
-                    ontouchstart="onGainSliderTouch()"
-                    ontouchend="onGainSliderRelease()"
-                    style="top: 120px;"
                 >
                 <div class="slider-labels-gain">
                     <span id="gainMaxLabel">0</span>
@@ -630,24 +687,24 @@ HTML_TEMPLATE = """
     <div class="container">
         <h1>Contrôles</h1>
         
-        <div class="control-buttons" style="flex-direction: column; gap: 15px; align-items: stretch; margin: 20px 0;">
-            <button class="toggle-button disabled" id="zebraToggle" onclick="toggleZebra()">
+        <div class="control-buttons stretched">
+            <button class="toggle-button disabled" id="zebraToggle" onclick="toggleSetting('zebra')">
                 Zebra: OFF
             </button>
             
-            <button class="toggle-button disabled" id="focusAssistToggle" onclick="toggleFocusAssist()">
+            <button class="toggle-button disabled" id="focusAssistToggle" onclick="toggleSetting('focusAssist')">
                 Focus Assist: OFF
             </button>
             
-            <button class="toggle-button disabled" id="falseColorToggle" onclick="toggleFalseColor()">
+            <button class="toggle-button disabled" id="falseColorToggle" onclick="toggleSetting('falseColor')">
                 False Color: OFF
             </button>
             
-            <button class="toggle-button disabled" id="cleanfeedToggle" onclick="toggleCleanfeed()">
+            <button class="toggle-button disabled" id="cleanfeedToggle" onclick="toggleSetting('cleanfeed')">
                 Cleanfeed: OFF
             </button>
             
-            <button class="control-button" id="autofocusBtn" onclick="doAutoFocus()" style="width: 100%; margin-top: 10px;">
+            <button class="control-button autofocus-button" id="autofocusBtn" onclick="doAutoFocus()">
                 🔍 Autofocus
             </button>
         </div>
@@ -657,192 +714,224 @@ HTML_TEMPLATE = """
     </div>
     
     <script>
+        // Cache des éléments du DOM : chaque id n'est recherché qu'une seule fois
+        const elementCache = {};
+        function byId(id) {
+            let element = elementCache[id];
+            if (element === undefined) {
+                element = document.getElementById(id);
+                if (element) elementCache[id] = element;
+            }
+            return element;
+        }
+        
+        // Écrit le texte d'un élément seulement s'il a changé (évite une mutation du DOM inutile)
+        function setText(element, text) {
+            if (element && element.textContent !== text) {
+                element.textContent = text;
+            }
+        }
+        
+        // Labels "envoyé" en attente : pendant un glissement, écrits au plus une fois par frame
+        const pendingSentLabels = {};
+        let sentLabelsRenderScheduled = false;
+        function setSentLabel(id, text) {
+            pendingSentLabels[id] = text;
+            if (!sentLabelsRenderScheduled) {
+                sentLabelsRenderScheduled = true;
+                requestAnimationFrame(renderSentLabels);
+            }
+        }
+        function renderSentLabels() {
+            sentLabelsRenderScheduled = false;
+            for (const id in pendingSentLabels) {
+                const element = byId(id);
+                setText(element, pendingSentLabels[id]);
+                delete pendingSentLabels[id];
+            }
+        }
+        
         // Fonction pour mettre à jour le statut global (définie en premier)
+        // Classes du statut global, construites une seule fois
+        const GLOBAL_STATUS_CLASSES = {
+            connected: 'global-status connected',
+            disconnected: 'global-status disconnected',
+        };
+        
         function updateGlobalStatus(status, message) {
             
-            const statusEl = document.getElementById('globalStatus');
+            const statusEl = byId('globalStatus');
             if (statusEl) {
-                statusEl.className = 'global-status ' + status;
-                statusEl.textContent = message;
-                
-            } else {
-                
+                // Appelé à chaque événement WebSocket : ne toucher au DOM que si le statut change
+                const className = GLOBAL_STATUS_CLASSES[status] || 'global-status ' + status;
+                if (statusEl.className !== className) {
+                    statusEl.className = className;
+                }
+                setText(statusEl, message);
             }
         }
         
+        // Envoie une requête POST JSON et signale les erreurs dans le statut global.
+        // onFailure (optionnel) est appelé avant la mise à jour du statut si la requête échoue.
+        // La promesse renvoyée résout avec la réponse décodée, ou null en cas d'erreur réseau.
+        function postJson(url, payload, onFailure) {
+            return fetch(url, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify(payload)
+            })
+            .then(response => response.json())
+            .then(data => {
+                if (!data.success) {
+                    if (onFailure) onFailure();
+                    updateGlobalStatus('disconnected', 'Erreur: ' + (data.error || 'Inconnue'));
+                }
+                return data;
+            })
+            .catch(error => {
+                if (onFailure) onFailure();
+                updateGlobalStatus('disconnected', 'Erreur de connexion');
+                console.error('Error:', error);
+                return null;
+            });
+        }
+        
         // Variables globales
         let socket = null;
         let websocketEventsReceived = false;
+        let zoomDescription = null; // Description du zoom (focales), reçue avec les valeurs initiales
         
-        let isUpdating = false;
         let sentValue = 0;
         let actualValue = 0;
-        let sliderLocked = false;
-        let sliderLockTimeout = null;
         
         // Throttling pour limiter la fréquence d'envoi
-        let lastFocusSendTime = 0;
-        let lastIrisSendTime = 0;
-        let lastGainSendTime = 0;
-        let lastShutterSendTime = 0;
         const FOCUS_MIN_INTERVAL = 100; // 10 fois/seconde max (100ms)
         const OTHER_MIN_INTERVAL = 500; // 2 fois/seconde max (500ms)
-        let pendingFocusValue = null;
-        let pendingIrisValue = null;
-        let pendingGainValue = null;
-        let pendingShutterValue = null;
-        
-        // Quand on touche le slider
         
-        window.onSliderTouch = function() {
+        // Crée une fonction d'envoi limitée à un appel toutes les minInterval ms.
+        // Pendant l'attente, seuls les derniers arguments sont conservés et envoyés à
+        // l'échéance par un unique timer propre au canal.
+        function createThrottledSender(minInterval, send) {
+            let lastSendTime = -Infinity;
+            let pendingArgs = null;
+            let timer = null;
             
-            sliderLocked = true;
-            // Annuler le timeout précédent s'il existe
-            if (sliderLockTimeout) {
-                clearTimeout(sliderLockTimeout);
+            function flush() {
+                timer = null;
+                const args = pendingArgs;
+                pendingArgs = null;
+                lastSendTime = performance.now();
+                send(...args);
             }
-        };
-        
-        // Quand on relâche le slider
-        
-        window.onSliderRelease = function() {
-            
-            // Verrouiller pendant 2 secondes après le relâchement
-            if (sliderLockTimeout) {
-                clearTimeout(sliderLockTimeout);
-            }
-            sliderLockTimeout = setTimeout(() => {
-                sliderLocked = false;
-                // Remettre le slider à la valeur réelle après 2 secondes
-                const slider = document.getElementById('focusSlider');
-                if (slider && actualValue !== null && actualValue !== undefined) {
-                    slider.value = actualValue;
-        }
-            }, 2000); // 2 secondes
-        };
-        
-        // Fonction pour envoyer le focus avec throttling
-        function sendFocusValue(value) {
-            const now = Date.now();
-            const timeSinceLastSend = now - lastFocusSendTime;
             
-            if (timeSinceLastSend < FOCUS_MIN_INTERVAL) {
-                // Trop tôt, stocker la valeur pour l'envoyer plus tard
-                pendingFocusValue = value;
-                setTimeout(() => {
-                    if (pendingFocusValue !== null) {
-                        const val = pendingFocusValue;
-                        pendingFocusValue = null;
-                        sendFocusValue(val);
+            return function(...args) {
+                const wait = minInterval - (performance.now() - lastSendTime);
+                if (wait > 0) {
+                    // Trop tôt : remplacer la valeur en attente, armer le timer une seule fois
+                    pendingArgs = args;
+                    if (timer === null) {
+                        timer = setTimeout(flush, wait);
                     }
-                }, FOCUS_MIN_INTERVAL - timeSinceLastSend);
-                return;
-            }
-            
-            lastFocusSendTime = now;
-            
-            fetch('/set_focus', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({ value: value })
-            })
-            .then(response => {
-                
-                return response.json();
-            })
-            .then(data => {
-                
-                if (data.success) {
-                    // Ne pas mettre à jour le statut ici, on attend les événements WebSocket
-                    // La valeur réelle sera mise à jour via WebSocket
-                } else {
-                    updateGlobalStatus('disconnected', 'Erreur: ' + (data.error || 'Inconnue'));
+                    return;
                 }
-            })
-            .catch(error => {
-                
-                updateGlobalStatus('disconnected', 'Erreur de connexion');
-                console.error('Error:', error);
-            });
+                // Envoi immédiat : une valeur en attente plus ancienne devient obsolète
+                if (timer !== null) {
+                    clearTimeout(timer);
+                    timer = null;
+                    pendingArgs = null;
+                }
+                lastSendTime = performance.now();
+                send(...args);
+            };
+        }
+        
+        // Verrou d'un slider : tant qu'il est actif (manipulation puis 2 secondes après le
+        // relâchement), les valeurs reçues de la caméra ne déplacent pas le curseur.
+        // restore est appelé au déverrouillage pour remettre le slider à la valeur réelle.
+        const SLIDER_RELEASE_DELAY = 2000;
+        function createSliderLock(restore) {
+            let timer = null;
+            const lock = {
+                locked: false,
+                hold() {
+                    lock.locked = true;
+                    if (timer) {
+                        clearTimeout(timer);
+                        timer = null;
+                    }
+                },
+                release() {
+                    if (timer) clearTimeout(timer);
+                    timer = setTimeout(() => {
+                        timer = null;
+                        lock.locked = false;
+                        restore();
+                    }, SLIDER_RELEASE_DELAY);
+                },
+            };
+            return lock;
         }
         
+        const focusSliderLock = createSliderLock(() => {
+            const slider = byId('focusSlider');
+            if (slider && actualValue !== null && actualValue !== undefined) {
+                slider.value = actualValue;
+            }
+        });
+        
+        // Envoi du focus avec throttling
+        // Pas de mise à jour du statut en cas de succès : la valeur réelle arrive via WebSocket
+        const sendFocusValue = createThrottledSender(FOCUS_MIN_INTERVAL, (value) => {
+            postJson('/set_focus', { value: value });
+        });
+        
         // Mettre à jour le focus quand le slider change
         
-        window.updateFocus = function(value) {
-            
-            if (isUpdating) return;
+        window.updateFocus = function(value, sliderEl) {
             
             const numValue = parseFloat(value);
             sentValue = numValue;
             
             // Mettre à jour le slider avec la valeur envoyée
-            const slider = document.getElementById('focusSlider');
+            // (élément transmis par le gestionnaire délégué, sinon recherche par id)
+            const slider = sliderEl || byId('focusSlider');
             if (slider) {
                 slider.value = numValue;
             }
             
-            document.getElementById('focusValueSent').textContent = numValue.toFixed(3);
+            setSentLabel('focusValueSent', numValue.toFixed(3));
             
             // Verrouiller le slider pendant la manipulation
-            sliderLocked = true;
-            if (sliderLockTimeout) {
-                clearTimeout(sliderLockTimeout);
-            }
+            focusSliderLock.hold();
             
             // Envoyer avec throttling
             sendFocusValue(numValue);
         };
         
-        // Handler WebSocket pour les changements de focus
-        if (socket) {
-        socket.on('focus_changed', (data) => {
-                if (!websocketEventsReceived) {
-                    // Premier événement reçu, arrêter le polling de secours
-                    websocketEventsReceived = true;
-                    stopPollingFallback();
-                    console.log('WebSocket actif, arrêt du polling de secours');
-                }
-            const value = data.normalised !== undefined ? data.normalised : data.value;
-            if (value !== null && value !== undefined) {
-                actualValue = value;
-                document.getElementById('focusValueActual').textContent = value.toFixed(3);
-                
-                // Mettre à jour le slider seulement si on n'est pas en train de le manipuler
-                if (!sliderLocked) {
-                    const slider = document.getElementById('focusSlider');
-                    if (slider) {
-                        slider.value = value;
-                    }
-                }
-                
-                    // Si on reçoit des événements, le WebSocket fonctionne
-                    updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
-            } else {
-                console.warn('focus_changed: value is null or undefined', data);
-            }
-        });
-        }
-        
         // Réinitialiser le focus à 0.5
         function resetFocus() {
             updateFocus(0.5);
         }
         
         // Variables pour l'iris
-        let isUpdatingIris = false;
         let sentIrisApertureStop = null;
         let actualIrisApertureStop = null;
-        let irisSliderLocked = false;
-        let irisSliderLockTimeout = null;
         let supportedApertureStops = [];
         
         // Charger les ouvertures supportées depuis la description de l'iris
+        // Clé de la dernière description d'iris traitée : le polling la renvoie à chaque
+        // tick, la liste des ouvertures n'est recalculée que si elle change
+        let lastIrisDescriptionKey = null;
+        
         function loadSupportedApertureStopsFromDescription(irisDesc) {
+            const apertureRange = irisDesc.apertureStop || {};
+            const descriptionKey = irisDesc.controllable + '|' + apertureRange.min + '|' + apertureRange.max;
+            if (descriptionKey === lastIrisDescriptionKey) return;
+            lastIrisDescriptionKey = descriptionKey;
+            
             // Vérifier si l'iris est contrôlable
             if (irisDesc.controllable === false) {
-                console.warn('L\'iris n\'est pas contrôlable');
+                console.warn('L\\'iris n\\'est pas contrôlable');
                 return;
             }
             
@@ -854,25 +943,25 @@ HTML_TEMPLATE = """
                 
                 // Générer une liste d'ouvertures entre min et max
                 // Utiliser les stops standards (chaque stop = √2 ≈ 1.414)
-                supportedApertureStops = [];
+                // La suite est croissante par construction : ni tri ni dédoublonnage par Set
+                const stops = [];
                 let current = minAperture;
                 while (current <= maxAperture) {
-                    supportedApertureStops.push(Math.round(current * 10) / 10); // Arrondir à 1 décimale
-                    current *= Math.sqrt(2); // Passer au stop suivant
+                    stops.push(Math.round(current * 10) / 10); // Arrondir à 1 décimale
+                    current *= Math.SQRT2; // Passer au stop suivant
                 }
-                // S'assurer que max est inclus
-                if (supportedApertureStops.length === 0 || supportedApertureStops[supportedApertureStops.length - 1] < maxAperture) {
-                    supportedApertureStops.push(Math.round(maxAperture * 10) / 10);
+                // S'assurer que max est inclus (sans doublon après arrondi)
+                const roundedMax = Math.round(maxAperture * 10) / 10;
+                if (stops.length === 0 || stops[stops.length - 1] < roundedMax) {
+                    stops.push(roundedMax);
                 }
+                supportedApertureStops = stops;
                 
-                // Trier et dédupliquer
-                supportedApertureStops = [...new Set(supportedApertureStops)].sort((a, b) => a - b);
-                
-                console.log('Ouvertures supportées chargées depuis l\'API:', supportedApertureStops);
+                console.log('Ouvertures supportées chargées depuis l\\'API:', supportedApertureStops);
             } else {
                 // Fallback: utiliser une liste standard si l'API ne fournit pas les infos
                 supportedApertureStops = [1.4, 2.0, 2.8, 4.0, 5.6, 8.0, 11.0, 16.0, 22.0];
-                console.warn('Description de l\'iris incomplète, utilisation de valeurs par défaut');
+                console.warn('Description de l\\'iris incomplète, utilisation de valeurs par défaut');
             }
             
             // Mettre à jour les labels du slider
@@ -881,104 +970,78 @@ HTML_TEMPLATE = """
         
         // Mettre à jour les labels du slider iris
         function updateIrisSliderLabels() {
-            const minLabel = document.getElementById('irisMinLabel');
-            const midLabel = document.getElementById('irisMidLabel');
-            const maxLabel = document.getElementById('irisMaxLabel');
-            if (supportedApertureStops.length > 0) {
-                const minAperture = supportedApertureStops[0];
-                const maxAperture = supportedApertureStops[supportedApertureStops.length - 1];
-                
-                // Min en bas (dernier span)
-                if (minLabel) {
-                    minLabel.textContent = 'f/' + minAperture.toFixed(1);
-                }
-                
-                // Max en haut (premier span)
-                if (maxLabel) {
-                    maxLabel.textContent = 'f/' + maxAperture.toFixed(1);
-                }
-                
-                // Mid au milieu
-                if (midLabel && supportedApertureStops.length > 1) {
-                    const midIndex = Math.floor(supportedApertureStops.length / 2);
-                    midLabel.textContent = 'f/' + supportedApertureStops[midIndex].toFixed(1);
-                } else if (midLabel) {
-                    midLabel.textContent = '';
-                }
-                
-                // Mettre à jour les attributs min/max du slider
-                const slider = document.getElementById('irisSlider');
-                if (slider) {
-                    slider.min = minAperture;
-                    slider.max = maxAperture;
-                    slider.step = 0.1;
-                }
+            updateSliderRange('iris', supportedApertureStops, (stop) => 'f/' + stop.toFixed(1));
+            const slider = byId('irisSlider');
+            if (slider && supportedApertureStops.length > 0) {
+                slider.step = 0.1;
             }
         }
         
-        // Charger les ouvertures supportées depuis l'API
-        function loadSupportedApertureStops() {
-            fetch('/get_initial_values')
-                .then(response => response.json())
-                .then(data => {
-                    if (data.success && data.irisDescription) {
-                        loadSupportedApertureStopsFromDescription(data.irisDescription);
-                    } else {
-                        // Fallback: utiliser une liste standard
-                        supportedApertureStops = [1.4, 2.0, 2.8, 4.0, 5.6, 8.0, 11.0, 16.0, 22.0];
-                        console.warn('Impossible de charger la description de l\'iris, utilisation de valeurs par défaut');
-                        updateIrisSliderLabels();
-                    }
-                })
-                .catch(error => {
-                    console.error('Erreur lors du chargement des ouvertures supportées:', error);
-                    // Fallback: utiliser une liste standard
-                    supportedApertureStops = [1.4, 2.0, 2.8, 4.0, 5.6, 8.0, 11.0, 16.0, 22.0];
-                    updateIrisSliderLabels();
-                });
+        // Met à jour les graduations (min en bas, milieu, max en haut) et les bornes d'un slider
+        // à partir de la liste triée de ses valeurs supportées. prefix: 'iris' ou 'gain'.
+        function updateSliderRange(prefix, sortedValues, format) {
+            if (sortedValues.length === 0) return;
+            const minValue = sortedValues[0];
+            const maxValue = sortedValues[sortedValues.length - 1];
+            
+            setText(byId(prefix + 'MinLabel'), format(minValue));
+            setText(byId(prefix + 'MaxLabel'), format(maxValue));
+            // Mid au milieu (vide s'il n'y a qu'une valeur)
+            setText(byId(prefix + 'MidLabel'),
+                sortedValues.length > 1 ? format(sortedValues[Math.floor(sortedValues.length / 2)]) : '');
+            
+            const slider = byId(prefix + 'Slider');
+            if (slider) {
+                slider.min = minValue;
+                slider.max = maxValue;
+            }
+        }
+        
+        // Ouvertures par défaut si la description de l'iris n'est pas disponible
+        function useDefaultApertureStops() {
+            supportedApertureStops = [1.4, 2.0, 2.8, 4.0, 5.6, 8.0, 11.0, 16.0, 22.0];
+            updateIrisSliderLabels();
+        }
+        
+        // Valeur la plus proche dans un tableau trié par ordre croissant (recherche dichotomique).
+        // En cas d'égalité, la plus petite des deux valeurs est retenue.
+        function findNearestSorted(sorted, value) {
+            let lo = 0;
+            let hi = sorted.length - 1;
+            while (lo < hi) {
+                const mid = (lo + hi) >> 1;
+                if (sorted[mid] < value) {
+                    lo = mid + 1;
+                } else {
+                    hi = mid;
+                }
+            }
+            if (lo > 0 && Math.abs(value - sorted[lo - 1]) <= Math.abs(sorted[lo] - value)) {
+                return sorted[lo - 1];
+            }
+            return sorted[lo];
         }
         
         // Trouver la valeur d'ouverture la plus proche dans la liste supportée
         function findNearestApertureStop(value) {
             if (supportedApertureStops.length === 0) return value;
-            return supportedApertureStops.reduce((prev, curr) => {
-                return Math.abs(curr - value) < Math.abs(prev - value) ? curr : prev;
-            });
+            return findNearestSorted(supportedApertureStops, value);
         }
         
-        // Quand on touche le slider iris
-        window.onIrisSliderTouch = function() {
-            irisSliderLocked = true;
-            if (irisSliderLockTimeout) {
-                clearTimeout(irisSliderLockTimeout);
-            }
-        };
-        
-        // Quand on relâche le slider iris
-        window.onIrisSliderRelease = function() {
-            if (irisSliderLockTimeout) {
-                clearTimeout(irisSliderLockTimeout);
-            }
-            irisSliderLockTimeout = setTimeout(() => {
-                irisSliderLocked = false;
-                // Remettre le slider à la valeur réelle après 2 secondes
-                const slider = document.getElementById('irisSlider');
-                if (slider && actualIrisApertureStop !== null && actualIrisApertureStop !== undefined) {
-                    // Trouver la valeur la plus proche dans supportedApertureStops
-                    if (supportedApertureStops.length > 0) {
-                        const nearestAperture = findNearestApertureStop(actualIrisApertureStop);
-                        slider.value = nearestAperture;
-                    } else {
-                        slider.value = actualIrisApertureStop;
-                    }
+        const irisSliderLock = createSliderLock(() => {
+            const slider = byId('irisSlider');
+            if (slider && actualIrisApertureStop !== null && actualIrisApertureStop !== undefined) {
+                // Trouver la valeur la plus proche dans supportedApertureStops
+                if (supportedApertureStops.length > 0) {
+                    slider.value = findNearestApertureStop(actualIrisApertureStop);
+                } else {
+                    slider.value = actualIrisApertureStop;
                 }
-            }, 2000);
-        };
+            }
+        });
         
         // Mettre à jour l'iris quand le slider change
-        window.updateIris = function(value) {
-            if (isUpdatingIris) return;
-            
+        window.updateIris = function(value, sliderEl) {
             const numValue = parseFloat(value);
             
             // Trouver la valeur la plus proche dans supportedApertureStops
@@ -987,96 +1050,45 @@ HTML_TEMPLATE = """
                 targetAperture = findNearestApertureStop(numValue);
             }
             
+            // Pendant un glissement, plusieurs positions tombent sur la même ouverture :
+            // ne renvoyer la commande que si l'ouverture visée change (remis à zéro au
+            // toucher et au relâchement, voir SLIDER_HANDLERS)
+            const unchanged = targetAperture === sentIrisApertureStop;
             sentIrisApertureStop = targetAperture;
             
             // Mettre à jour le slider avec la valeur envoyée
-            const slider = document.getElementById('irisSlider');
+            const slider = sliderEl || byId('irisSlider');
             if (slider) {
                 slider.value = targetAperture;
             }
             
             // Verrouiller le slider pendant la manipulation
-            irisSliderLocked = true;
-            if (irisSliderLockTimeout) {
-                clearTimeout(irisSliderLockTimeout);
-            }
+            irisSliderLock.hold();
             
             // Envoyer avec throttling (on envoie la valeur normalisée correspondante)
-            sendIrisApertureStop(targetAperture);
+            if (!unchanged) {
+                sendIrisApertureStop(targetAperture);
+            }
         };
         
         // Mettre à jour la valeur de l'iris (fonction interne pour compatibilité)
         function updateIrisValue(value) {
-            if (isUpdatingIris) return;
-            
+            sentIrisApertureStop = null; // Envoi hors slider : la dernière ouverture envoyée n'est plus fiable
             const numValue = Math.max(0.0, Math.min(1.0, parseFloat(value)));
             
             // Envoyer avec throttling
             sendIrisValue(numValue);
         }
         
-        // Fonction pour envoyer l'iris avec throttling (valeur normalisée)
-        function sendIrisValue(value) {
-            const now = Date.now();
-            const timeSinceLastSend = now - lastIrisSendTime;
-            
-            if (timeSinceLastSend < OTHER_MIN_INTERVAL) {
-                // Trop tôt, stocker la valeur pour l'envoyer plus tard
-                pendingIrisValue = value;
-                setTimeout(() => {
-                    if (pendingIrisValue !== null) {
-                        const val = pendingIrisValue;
-                        pendingIrisValue = null;
-                        sendIrisValue(val);
-                    }
-                }, OTHER_MIN_INTERVAL - timeSinceLastSend);
-                return;
-            }
-            
-            lastIrisSendTime = now;
-            
-            fetch('/set_iris', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({ value: value })
-            })
-            .then(response => response.json())
-            .then(data => {
-                if (data.success) {
-                    // Ne pas mettre à jour le statut ici, on attend les événements WebSocket
-                    // La valeur réelle sera mise à jour via WebSocket
-                } else {
-                    updateGlobalStatus('disconnected', 'Erreur: ' + (data.error || 'Inconnue'));
-                }
-            })
-            .catch(error => {
-                updateGlobalStatus('disconnected', 'Erreur de connexion');
-                console.error('Error:', error);
-            });
-        }
+        // Envoi de l'iris (valeur normalisée) avec throttling ; un seul canal pour les deux
+        // fonctions ci-dessous, la dernière commande l'emporte
+        // Pas de mise à jour du statut en cas de succès : la valeur réelle arrive via WebSocket
+        const sendIrisValue = createThrottledSender(OTHER_MIN_INTERVAL, (value) => {
+            postJson('/set_iris', { value: value });
+        });
         
         // Fonction pour envoyer l'aperture stop directement
         function sendIrisApertureStop(apertureStop) {
-            const now = Date.now();
-            const timeSinceLastSend = now - lastIrisSendTime;
-            
-            if (timeSinceLastSend < OTHER_MIN_INTERVAL) {
-                // Trop tôt, stocker la valeur pour l'envoyer plus tard
-                pendingIrisValue = { apertureStop: apertureStop };
-                setTimeout(() => {
-                    if (pendingIrisValue !== null && pendingIrisValue.apertureStop !== undefined) {
-                        const val = pendingIrisValue.apertureStop;
-                        pendingIrisValue = null;
-                        sendIrisApertureStop(val);
-                    }
-                }, OTHER_MIN_INTERVAL - timeSinceLastSend);
-                return;
-            }
-            
-            lastIrisSendTime = now;
-            
             // Convertir l'aperture stop en valeur normalisée approximative
             // f/1.4 = 0.0, f/22 = 1.0 (approximation linéaire)
             const minAperture = supportedApertureStops.length > 0 ? supportedApertureStops[0] : 1.4;
@@ -1084,62 +1096,7 @@ HTML_TEMPLATE = """
             const normalisedValue = (apertureStop - minAperture) / (maxAperture - minAperture);
             const clampedValue = Math.max(0.0, Math.min(1.0, normalisedValue));
             
-            fetch('/set_iris', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({ value: clampedValue })
-            })
-            .then(response => response.json())
-            .then(data => {
-                if (data.success) {
-                    // Ne pas mettre à jour le statut ici, on attend les événements WebSocket
-                } else {
-                    updateGlobalStatus('disconnected', 'Erreur: ' + (data.error || 'Inconnue'));
-                }
-            })
-            .catch(error => {
-                updateGlobalStatus('disconnected', 'Erreur de connexion');
-                console.error('Error:', error);
-            });
-        }
-        
-        // Handler WebSocket pour les changements d'iris
-        if (socket) {
-        socket.on('iris_changed', (data) => {
-            if (!websocketEventsReceived) {
-                websocketEventsReceived = true;
-                stopPollingFallback();
-                console.log('WebSocket actif, arrêt du polling de secours');
-            }
-            const apertureStop = data.apertureStop;
-            
-            if (apertureStop !== null && apertureStop !== undefined) {
-                actualIrisApertureStop = apertureStop;
-                document.getElementById('irisApertureStop').textContent = 'f/' + apertureStop.toFixed(1);
-                
-                // Mettre à jour le slider seulement si on n'est pas en train de le manipuler
-                if (!irisSliderLocked) {
-                    const slider = document.getElementById('irisSlider');
-                    if (slider) {
-                        // Trouver la valeur la plus proche dans supportedApertureStops
-                        if (supportedApertureStops.length > 0) {
-                            const nearestAperture = findNearestApertureStop(apertureStop);
-                            slider.value = nearestAperture;
-                        } else {
-                            slider.value = apertureStop;
-                        }
-                    }
-                }
-            } else {
-                document.getElementById('irisApertureStop').textContent = '-';
-            }
-            
-            // Si on reçoit des événements, le WebSocket fonctionne
-            updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
-            console.log('Iris mis à jour via WebSocket:', apertureStop);
-        });
+            sendIrisValue(clampedValue);
         }
         
         // Réinitialiser l'iris à 0.5
@@ -1147,43 +1104,9 @@ HTML_TEMPLATE = """
             updateIrisValue(0.5);
         }
         
-        // Handlers WebSocket pour les changements de paramètres
-        
-        // Handler pour les changements de zoom
-        if (socket) {
-        socket.on('zoom_changed', (data) => {
-            if (!websocketEventsReceived) {
-                websocketEventsReceived = true;
-                stopPollingFallback();
-                console.log('WebSocket actif, arrêt du polling de secours');
-            }
-            const focal = data.focalLength;
-            const norm = data.normalised;
-            
-            if (focal !== null && focal !== undefined) {
-                document.getElementById('zoomFocalLength').textContent = focal + ' mm';
-            } else {
-                document.getElementById('zoomFocalLength').textContent = '-';
-            }
-            
-            if (norm !== null && norm !== undefined) {
-                document.getElementById('zoomNormalised').textContent = norm.toFixed(3);
-            } else {
-                document.getElementById('zoomNormalised').textContent = '-';
-            }
-            
-            // Si on reçoit des événements, le WebSocket fonctionne
-            updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
-            console.log('Zoom mis à jour via WebSocket:', focal, norm);
-        });
-        }
-        
         // Variables pour le gain
-        let isUpdatingGain = false;
-        let sentGainValue = 0;
+        let sentGainValue = null;
         let actualGainValue = 0;
-        let gainSliderLocked = false;
-        let gainSliderLockTimeout = null;
         let supportedGains = [];
         
         // Charger les gains supportés
@@ -1193,38 +1116,7 @@ HTML_TEMPLATE = """
                 .then(data => {
                     if (data.success && data.supportedGains && data.supportedGains.length > 0) {
                         supportedGains = data.supportedGains.sort((a, b) => a - b);
-                        // Mettre à jour les labels du slider (ordre: max en haut, mid au milieu, min en bas)
-                        const minLabel = document.getElementById('gainMinLabel');
-                        const midLabel = document.getElementById('gainMidLabel');
-                        const maxLabel = document.getElementById('gainMaxLabel');
-                        if (supportedGains.length > 0) {
-                            const minGain = supportedGains[0];
-                            const maxGain = supportedGains[supportedGains.length - 1];
-                            
-                            // Min en bas (dernier span)
-                            if (minLabel) {
-                                minLabel.textContent = minGain + ' dB';
-                            }
-                            
-                            // Max en haut (premier span)
-                            if (maxLabel) {
-                                maxLabel.textContent = maxGain + ' dB';
-                            }
-                            
-                            // Mid au milieu
-                            if (midLabel && supportedGains.length > 1) {
-                                const midIndex = Math.floor(supportedGains.length / 2);
-                                midLabel.textContent = supportedGains[midIndex] + ' dB';
-                            } else if (midLabel) {
-                                midLabel.textContent = '';
-                            }
-                        }
-                        // Mettre à jour les attributs min/max du slider
-                        const slider = document.getElementById('gainSlider');
-                        if (slider && supportedGains.length > 0) {
-                            slider.min = supportedGains[0];
-                            slider.max = supportedGains[supportedGains.length - 1];
-                        }
+                        updateSliderRange('gain', supportedGains, (gain) => gain + ' dB');
                     }
                 })
                 .catch(error => {
@@ -1235,44 +1127,23 @@ HTML_TEMPLATE = """
         // Trouver la valeur de gain la plus proche dans la liste supportée
         function findNearestGain(value) {
             if (supportedGains.length === 0) return value;
-            return supportedGains.reduce((prev, curr) => {
-                return Math.abs(curr - value) < Math.abs(prev - value) ? curr : prev;
-            });
+            return findNearestSorted(supportedGains, value);
         }
         
-        // Quand on touche le slider gain
-        window.onGainSliderTouch = function() {
-            gainSliderLocked = true;
-            if (gainSliderLockTimeout) {
-                clearTimeout(gainSliderLockTimeout);
-            }
-        };
-        
-        // Quand on relâche le slider gain
-        window.onGainSliderRelease = function() {
-            if (gainSliderLockTimeout) {
-                clearTimeout(gainSliderLockTimeout);
-            }
-            gainSliderLockTimeout = setTimeout(() => {
-                gainSliderLocked = false;
-                // Remettre le slider à la valeur réelle après 2 secondes
-                const slider = document.getElementById('gainSlider');
-                if (slider && actualGainValue !== null && actualGainValue !== undefined) {
-                    // Trouver la valeur la plus proche dans supportedGains
-                    if (supportedGains.length > 0) {
-                        const nearestGain = findNearestGain(actualGainValue);
-                        slider.value = nearestGain;
-                    } else {
-                        slider.value = actualGainValue;
-                    }
+        const gainSliderLock = createSliderLock(() => {
+            const slider = byId('gainSlider');
+            if (slider && actualGainValue !== null && actualGainValue !== undefined) {
+                // Trouver la valeur la plus proche dans supportedGains
+                if (supportedGains.length > 0) {
+                    slider.value = findNearestGain(actualGainValue);
+                } else {
+                    slider.value = actualGainValue;
                 }
-            }, 2000);
-        };
+            }
+        });
         
         // Mettre à jour le gain quand le slider change
-        window.updateGain = function(value) {
-            if (isUpdatingGain) return;
-            
+        window.updateGain = function(value, sliderEl) {
             const numValue = parseFloat(value);
             
             // Trouver la valeur la plus proche dans supportedGains
@@ -1281,35 +1152,35 @@ HTML_TEMPLATE = """
                 targetValue = findNearestGain(numValue);
             }
             
+            // Même logique que pour l'iris : ne renvoyer que si le gain visé change
+            // pendant le glissement en cours
+            const unchanged = targetValue === sentGainValue;
             sentGainValue = targetValue;
             
             // Mettre à jour le slider avec la valeur envoyée
-            const slider = document.getElementById('gainSlider');
+            const slider = sliderEl || byId('gainSlider');
             if (slider) {
                 slider.value = targetValue;
             }
             
-            document.getElementById('gainValueSent').textContent = targetValue + ' dB';
+            setSentLabel('gainValueSent', targetValue + ' dB');
             
             // Verrouiller le slider pendant la manipulation
-            gainSliderLocked = true;
-            if (gainSliderLockTimeout) {
-                clearTimeout(gainSliderLockTimeout);
-            }
+            gainSliderLock.hold();
             
             // Envoyer avec throttling
-            sendGainValue(targetValue);
+            if (!unchanged) {
+                sendGainValue(targetValue);
+            }
         };
         
         // Mettre à jour la valeur du gain (fonction interne)
         function updateGainValue(value) {
-            if (isUpdatingGain) return;
-            
             sentGainValue = value;
-            document.getElementById('gainValueSent').textContent = value + ' dB';
+            setSentLabel('gainValueSent', value + ' dB');
             
             // Mettre à jour le slider
-            const slider = document.getElementById('gainSlider');
+            const slider = byId('gainSlider');
             if (slider) {
                 slider.value = value;
             }
@@ -1318,84 +1189,11 @@ HTML_TEMPLATE = """
             sendGainValue(value);
         }
         
-        // Fonction pour envoyer le gain avec throttling
-        function sendGainValue(value) {
-            const now = Date.now();
-            const timeSinceLastSend = now - lastGainSendTime;
-            
-            if (timeSinceLastSend < OTHER_MIN_INTERVAL) {
-                // Trop tôt, stocker la valeur pour l'envoyer plus tard
-                pendingGainValue = value;
-                setTimeout(() => {
-                    if (pendingGainValue !== null) {
-                        const val = pendingGainValue;
-                        pendingGainValue = null;
-                        sendGainValue(val);
-                    }
-                }, OTHER_MIN_INTERVAL - timeSinceLastSend);
-                return;
-            }
-            
-            lastGainSendTime = now;
-            
-            fetch('/set_gain', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({ value: value })
-            })
-            .then(response => response.json())
-            .then(data => {
-                if (data.success) {
-                    // Ne pas mettre à jour le statut ici, on attend les événements WebSocket
-                    // La valeur réelle sera mise à jour via WebSocket
-                } else {
-                    updateGlobalStatus('disconnected', 'Erreur: ' + (data.error || 'Inconnue'));
-                }
-            })
-            .catch(error => {
-                updateGlobalStatus('disconnected', 'Erreur de connexion');
-                console.error('Error:', error);
-            });
-        }
-        
-        // Récupérer la valeur actuelle du gain (GET)
-        // Handler WebSocket pour les changements de gain
-        if (socket) {
-        socket.on('gain_changed', (data) => {
-            if (!websocketEventsReceived) {
-                websocketEventsReceived = true;
-                stopPollingFallback();
-                console.log('WebSocket actif, arrêt du polling de secours');
-            }
-            const value = data.gain !== undefined ? data.gain : data.value;
-            if (value !== null && value !== undefined) {
-                actualGainValue = value;
-                document.getElementById('gainValueActual').textContent = value + ' dB';
-                
-                // Mettre à jour le slider seulement si on n'est pas en train de le manipuler
-                if (!gainSliderLocked) {
-                    const slider = document.getElementById('gainSlider');
-                    if (slider) {
-                        // Trouver la valeur la plus proche dans supportedGains
-                        if (supportedGains.length > 0) {
-                            const nearestGain = findNearestGain(value);
-                            slider.value = nearestGain;
-                        } else {
-                            slider.value = value;
-                        }
-                    }
-                }
-                
-                // Si on reçoit des événements, le WebSocket fonctionne
-                updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
-                console.log('Gain mis à jour via WebSocket:', value);
-            } else {
-                console.warn('gain_changed: value is null or undefined', data);
-            }
+        // Envoi du gain avec throttling
+        // Pas de mise à jour du statut en cas de succès : la valeur réelle arrive via WebSocket
+        const sendGainValue = createThrottledSender(OTHER_MIN_INTERVAL, (value) => {
+            postJson('/set_gain', { value: value });
         });
-        }
         
         // Réinitialiser le gain à 0
         function resetGain() {
@@ -1407,7 +1205,6 @@ HTML_TEMPLATE = """
         }
         
         // Variables pour le shutter
-        let isUpdatingShutter = false;
         let sentShutterValue = 0;
         let actualShutterValue = 0;
         let supportedShutterSpeeds = [];
@@ -1428,7 +1225,7 @@ HTML_TEMPLATE = """
         
         // Incrémenter le shutter
         function incrementShutter() {
-            if (isUpdatingShutter || supportedShutterSpeeds.length === 0) return;
+            if (supportedShutterSpeeds.length === 0) return;
             const currentValue = actualShutterValue !== null && actualShutterValue !== undefined ? actualShutterValue : sentShutterValue;
             const currentIndex = supportedShutterSpeeds.indexOf(currentValue);
             if (currentIndex < supportedShutterSpeeds.length - 1) {
@@ -1438,7 +1235,7 @@ HTML_TEMPLATE = """
         
         // Décrémenter le shutter
         function decrementShutter() {
-            if (isUpdatingShutter || supportedShutterSpeeds.length === 0) return;
+            if (supportedShutterSpeeds.length === 0) return;
             const currentValue = actualShutterValue !== null && actualShutterValue !== undefined ? actualShutterValue : sentShutterValue;
             const currentIndex = supportedShutterSpeeds.indexOf(currentValue);
             if (currentIndex > 0) {
@@ -1448,233 +1245,90 @@ HTML_TEMPLATE = """
         
         // Mettre à jour la valeur du shutter
         function updateShutterValue(value) {
-            if (isUpdatingShutter) return;
-            
             sentShutterValue = value;
-            document.getElementById('shutterValueSent').textContent = `1/${value}s`;
+            setSentLabel('shutterValueSent', `1/${value}s`);
             
             // Envoyer avec throttling
             sendShutterValue(value, 'ShutterSpeed');
         }
         
-        // Fonction pour envoyer le shutter avec throttling
-        function sendShutterValue(value, mode) {
-            const now = Date.now();
-            const timeSinceLastSend = now - lastShutterSendTime;
-            
-            if (timeSinceLastSend < OTHER_MIN_INTERVAL) {
-                // Trop tôt, stocker la valeur pour l'envoyer plus tard
-                pendingShutterValue = { value: value, mode: mode };
-                setTimeout(() => {
-                    if (pendingShutterValue !== null) {
-                        const val = pendingShutterValue.value;
-                        const m = pendingShutterValue.mode;
-                        pendingShutterValue = null;
-                        sendShutterValue(val, m);
-                    }
-                }, OTHER_MIN_INTERVAL - timeSinceLastSend);
-                return;
-            }
-            
-            lastShutterSendTime = now;
-            
-            fetch('/set_shutter', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ value: value, mode: mode })
-            })
-            .then(response => response.json())
-            .then(data => {
-                if (data.success) {
-                    // Ne pas mettre à jour le statut ici, on attend les événements WebSocket
-                    // La valeur réelle sera mise à jour via WebSocket
-                } else {
-                    updateGlobalStatus('disconnected', 'Erreur: ' + (data.error || 'Inconnue'));
-                }
-            })
-            .catch(error => {
-                updateGlobalStatus('disconnected', 'Erreur de connexion');
-                console.error('Error:', error);
-            });
-        }
-        
-        // Récupérer la valeur actuelle du shutter (GET)
-        // Handler WebSocket pour les changements de shutter
-        if (socket) {
-        socket.on('shutter_changed', (data) => {
-            if (!websocketEventsReceived) {
-                websocketEventsReceived = true;
-                stopPollingFallback();
-                console.log('WebSocket actif, arrêt du polling de secours');
-            }
-            const value = data.shutterSpeed;
-            if (value !== null && value !== undefined) {
-                actualShutterValue = value;
-                document.getElementById('shutterValueActual').textContent = `1/${value}s`;
-                // Si on reçoit des événements, le WebSocket fonctionne
-                updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
-                console.log('Shutter mis à jour via WebSocket:', value);
-            } else {
-                console.warn('shutter_changed: value is null or undefined', data);
-            }
+        // Envoi du shutter avec throttling
+        // Pas de mise à jour du statut en cas de succès : la valeur réelle arrive via WebSocket
+        const sendShutterValue = createThrottledSender(OTHER_MIN_INTERVAL, (value, mode) => {
+            postJson('/set_shutter', { value: value, mode: mode });
         });
-        }
         
-        // Variables pour les toggles
-        let zebraEnabled = false;
-        let focusAssistEnabled = false;
-        let falseColorEnabled = false;
-        let cleanfeedEnabled = false;
+        // État des toggles : une entrée par toggle (clé des données caméra, événement
+        // Socket.IO, route d'écriture, bouton associé) portant directement l'état courant
+        const TOGGLES = [
+            { key: 'zebra', event: 'zebra_changed', url: '/set_zebra', buttonId: 'zebraToggle', label: 'Zebra', enabled: false },
+            { key: 'focusAssist', event: 'focusAssist_changed', url: '/set_focus_assist', buttonId: 'focusAssistToggle', label: 'Focus Assist', enabled: false },
+            { key: 'falseColor', event: 'falseColor_changed', url: '/set_false_color', buttonId: 'falseColorToggle', label: 'False Color', enabled: false },
+            { key: 'cleanfeed', event: 'cleanfeed_changed', url: '/set_cleanfeed', buttonId: 'cleanfeedToggle', label: 'Cleanfeed', enabled: false },
+        ];
+        const TOGGLES_BY_KEY = {};
+        TOGGLES.forEach(toggle => { TOGGLES_BY_KEY[toggle.key] = toggle; });
+        
+        // Classes CSS et textes des boutons toggle, calculés une seule fois
+        const TOGGLE_CLASS_ON = 'toggle-button enabled';
+        const TOGGLE_CLASS_OFF = 'toggle-button disabled';
+        const TOGGLE_LABELS = {};
+        ['Zebra', 'Focus Assist', 'False Color', 'Cleanfeed'].forEach(label => {
+            TOGGLE_LABELS[label] = { on: label + ': ON', off: label + ': OFF' };
+        });
         
         // Fonction pour mettre à jour l'apparence d'un bouton toggle
         function updateToggleButton(buttonId, enabled, label) {
-            const button = document.getElementById(buttonId);
+            applyToggleButton(byId(buttonId), enabled, TOGGLE_LABELS[label]);
+        }
+        
+        // Variante pour un bouton et des textes déjà résolus
+        function applyToggleButton(button, enabled, texts) {
             if (button) {
-                button.className = enabled ? 'toggle-button enabled' : 'toggle-button disabled';
-                button.textContent = label + ': ' + (enabled ? 'ON' : 'OFF');
+                // Ne rien réécrire si le bouton est déjà dans l'état demandé
+                const className = enabled ? TOGGLE_CLASS_ON : TOGGLE_CLASS_OFF;
+                if (button.className === className) return;
+                button.className = className;
+                setText(button, enabled ? texts.on : texts.off);
             }
         }
         
-        // Toggle Zebra - rendre accessible globalement
-        window.toggleZebra = function() {
-            const newState = !zebraEnabled;
-            zebraEnabled = newState;
-            updateToggleButton('zebraToggle', newState, 'Zebra');
-            
-            fetch('/set_zebra', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ enabled: newState })
-            })
-            .then(response => response.json())
-            .then(data => {
-                if (data.success) {
-                    updateGlobalStatus('connected', 'Connecté');
-                } else {
-                    // Revert on error
-                    zebraEnabled = !newState;
-                    updateToggleButton('zebraToggle', !newState, 'Zebra');
-                    updateGlobalStatus('disconnected', 'Erreur: ' + (data.error || 'Inconnue'));
-                }
-            })
-            .catch(error => {
-                // Revert on error
-                zebraEnabled = !newState;
-                updateToggleButton('zebraToggle', !newState, 'Zebra');
-                updateGlobalStatus('disconnected', 'Erreur de connexion');
-                console.error('Error:', error);
-            });
-        };
-        
-        // Toggle Focus Assist - rendre accessible globalement
-        window.toggleFocusAssist = function() {
-            const newState = !focusAssistEnabled;
-            focusAssistEnabled = newState;
-            updateToggleButton('focusAssistToggle', newState, 'Focus Assist');
+        // Bascule d'un toggle (clé de TOGGLES), appelée par les boutons du panneau Contrôles.
+        // L'état est inversé immédiatement puis rétabli si la caméra refuse la requête.
+        window.toggleSetting = function(key) {
+            const toggle = TOGGLES_BY_KEY[key];
+            const newState = !toggle.enabled;
+            toggle.enabled = newState;
+            updateToggleButton(toggle.buttonId, newState, toggle.label);
             
-            fetch('/set_focus_assist', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ enabled: newState })
-            })
-            .then(response => response.json())
-            .then(data => {
-                if (data.success) {
-                    updateGlobalStatus('connected', 'Connecté');
-                } else {
-                    // Revert on error
-                    focusAssistEnabled = !newState;
-                    updateToggleButton('focusAssistToggle', !newState, 'Focus Assist');
-                    updateGlobalStatus('disconnected', 'Erreur: ' + (data.error || 'Inconnue'));
-                }
-            })
-            .catch(error => {
-                // Revert on error
-                focusAssistEnabled = !newState;
-                updateToggleButton('focusAssistToggle', !newState, 'Focus Assist');
-                updateGlobalStatus('disconnected', 'Erreur de connexion');
-                console.error('Error:', error);
-            });
-        };
-        
-        // Toggle False Color - rendre accessible globalement
-        window.toggleFalseColor = function() {
-            const newState = !falseColorEnabled;
-            falseColorEnabled = newState;
-            updateToggleButton('falseColorToggle', newState, 'False Color');
-            
-            fetch('/set_false_color', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ enabled: newState })
-            })
-            .then(response => response.json())
-            .then(data => {
-                if (data.success) {
-                    updateGlobalStatus('connected', 'Connecté');
-                } else {
-                    // Revert on error
-                    falseColorEnabled = !newState;
-                    updateToggleButton('falseColorToggle', !newState, 'False Color');
-                    updateGlobalStatus('disconnected', 'Erreur: ' + (data.error || 'Inconnue'));
-                }
-            })
-            .catch(error => {
+            postJson(toggle.url, { enabled: newState }, () => {
                 // Revert on error
-                falseColorEnabled = !newState;
-                updateToggleButton('falseColorToggle', !newState, 'False Color');
-                updateGlobalStatus('disconnected', 'Erreur de connexion');
-                console.error('Error:', error);
-            });
-        };
-        
-        // Toggle Cleanfeed - rendre accessible globalement
-        window.toggleCleanfeed = function() {
-            const newState = !cleanfeedEnabled;
-            cleanfeedEnabled = newState;
-            updateToggleButton('cleanfeedToggle', newState, 'Cleanfeed');
-            
-            fetch('/set_cleanfeed', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ enabled: newState })
+                toggle.enabled = !newState;
+                updateToggleButton(toggle.buttonId, !newState, toggle.label);
             })
-            .then(response => response.json())
             .then(data => {
-                if (data.success) {
+                if (data && data.success) {
                     updateGlobalStatus('connected', 'Connecté');
-                } else {
-                    // Revert on error
-                    cleanfeedEnabled = !newState;
-                    updateToggleButton('cleanfeedToggle', !newState, 'Cleanfeed');
-                    updateGlobalStatus('disconnected', 'Erreur: ' + (data.error || 'Inconnue'));
                 }
-            })
-            .catch(error => {
-                // Revert on error
-                cleanfeedEnabled = !newState;
-                updateToggleButton('cleanfeedToggle', !newState, 'Cleanfeed');
-                updateGlobalStatus('disconnected', 'Erreur de connexion');
-                console.error('Error:', error);
             });
         };
         
         // Autofocus - rendre accessible globalement
         window.doAutoFocus = function() {
-            const btn = document.getElementById('autofocusBtn');
+            const btn = byId('autofocusBtn');
             if (btn) {
                 btn.disabled = true;
                 btn.textContent = '🔍 Autofocus...';
             }
             
-            fetch('/do_autofocus', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ x: 0.5, y: 0.5 })
+            postJson('/do_autofocus', { x: 0.5, y: 0.5 }, () => {
+                if (btn) {
+                    btn.textContent = '🔍 Autofocus';
+                    btn.disabled = false;
+                }
             })
-            .then(response => response.json())
             .then(data => {
-                if (data.success) {
+                if (data && data.success) {
                     updateGlobalStatus('connected', 'Autofocus déclenché');
                     if (btn) {
                         btn.textContent = '✓ Autofocus OK';
@@ -1683,167 +1337,147 @@ HTML_TEMPLATE = """
                             btn.disabled = false;
                         }, 2000);
                     }
-                } else {
-                    updateGlobalStatus('disconnected', 'Erreur: ' + (data.error || 'Inconnue'));
-                    if (btn) {
-                        btn.textContent = '🔍 Autofocus';
-                        btn.disabled = false;
-                    }
-                }
-            })
-            .catch(error => {
-                updateGlobalStatus('disconnected', 'Erreur de connexion');
-                console.error('Error:', error);
-                if (btn) {
-                    btn.textContent = '🔍 Autofocus';
-                    btn.disabled = false;
                 }
             });
         };
         
-        // Handlers WebSocket pour les toggles
-        if (socket) {
-        socket.on('zebra_changed', (data) => {
-                if (!websocketEventsReceived) {
-                    websocketEventsReceived = true;
-                    stopPollingFallback();
-                    console.log('WebSocket actif, arrêt du polling de secours');
-                }
-            const enabled = data.enabled !== undefined ? data.enabled : (data.value !== undefined ? data.value : false);
-            zebraEnabled = enabled;
-            updateToggleButton('zebraToggle', enabled, 'Zebra');
-                // Si on reçoit des événements, le WebSocket fonctionne
-                updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
-        });
-        
-        socket.on('focusAssist_changed', (data) => {
-                if (!websocketEventsReceived) {
-                    websocketEventsReceived = true;
-                    stopPollingFallback();
-                    console.log('WebSocket actif, arrêt du polling de secours');
-                }
-            const enabled = data.enabled !== undefined ? data.enabled : (data.value !== undefined ? data.value : false);
-            focusAssistEnabled = enabled;
-            updateToggleButton('focusAssistToggle', enabled, 'Focus Assist');
-                // Si on reçoit des événements, le WebSocket fonctionne
-                updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
-        });
-        
-        socket.on('falseColor_changed', (data) => {
-                if (!websocketEventsReceived) {
-                    websocketEventsReceived = true;
-                    stopPollingFallback();
-                    console.log('WebSocket actif, arrêt du polling de secours');
-                }
-            const enabled = data.enabled !== undefined ? data.enabled : (data.value !== undefined ? data.value : false);
-            falseColorEnabled = enabled;
-            updateToggleButton('falseColorToggle', enabled, 'False Color');
-                // Si on reçoit des événements, le WebSocket fonctionne
-                updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
-        });
-        
-        socket.on('cleanfeed_changed', (data) => {
-                if (!websocketEventsReceived) {
-                    websocketEventsReceived = true;
-                    stopPollingFallback();
-                    console.log('WebSocket actif, arrêt du polling de secours');
-                }
-            const enabled = data.enabled !== undefined ? data.enabled : (data.value !== undefined ? data.value : false);
-            cleanfeedEnabled = enabled;
-            updateToggleButton('cleanfeedToggle', enabled, 'Cleanfeed');
-                // Si on reçoit des événements, le WebSocket fonctionne
-                updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
-        });
+        // Réponse /get_initial_values en attente d'affichage : appliquée au prochain frame,
+        // seule la plus récente compte (et rien n'est fait tant que l'onglet est masqué)
+        let pendingValuesData = null;
+        function scheduleValuesUpdate(data) {
+            const scheduled = pendingValuesData !== null;
+            pendingValuesData = data;
+            if (!scheduled) {
+                requestAnimationFrame(() => {
+                    const latest = pendingValuesData;
+                    pendingValuesData = null;
+                    updateValuesFromData(latest);
+                });
+            }
         }
         
         // Fonction pour mettre à jour les valeurs depuis les données reçues
         function updateValuesFromData(data) {
-            if (data.focus !== undefined) {
-                actualValue = data.focus;
-                document.getElementById('focusValueActual').textContent = data.focus.toFixed(3);
+            // Chaque champ est lu une seule fois puis réutilisé via une variable locale
+            const focus = data.focus;
+            if (focus !== undefined) {
+                actualValue = focus;
+                setText(byId('focusValueActual'), focus.toFixed(3));
+                renderedFocusStep = null; // Texte écrit hors renderFocusActual
                 
                 // Mettre à jour le slider seulement si on n'est pas en train de le manipuler
-                if (!sliderLocked) {
-                    const slider = document.getElementById('focusSlider');
+                if (!focusSliderLock.locked) {
+                    const slider = byId('focusSlider');
                     if (slider) {
-                        slider.value = data.focus;
+                        slider.value = focus;
                     }
                 }
             }
-            if (data.iris !== undefined) {
-                if (data.iris.apertureStop !== undefined) {
-                    actualIrisApertureStop = data.iris.apertureStop;
-                    document.getElementById('irisApertureStop').textContent = 'f/' + data.iris.apertureStop.toFixed(1);
+            const iris = data.iris;
+            if (iris !== undefined) {
+                const apertureStop = iris.apertureStop;
+                if (apertureStop !== undefined) {
+                    actualIrisApertureStop = apertureStop;
+                    setText(byId('irisApertureStop'), 'f/' + apertureStop.toFixed(1));
                     
                     // Mettre à jour le slider seulement si on n'est pas en train de le manipuler
-                    if (!irisSliderLocked) {
-                        const slider = document.getElementById('irisSlider');
+                    if (!irisSliderLock.locked) {
+                        const slider = byId('irisSlider');
                         if (slider) {
                             // Trouver la valeur la plus proche dans supportedApertureStops
                             if (supportedApertureStops.length > 0) {
-                                const nearestAperture = findNearestApertureStop(data.iris.apertureStop);
-                                slider.value = nearestAperture;
+                                slider.value = findNearestApertureStop(apertureStop);
                             } else {
-                                slider.value = data.iris.apertureStop;
+                                slider.value = apertureStop;
                             }
                         }
                     }
                 } else {
-                    document.getElementById('irisApertureStop').textContent = '-';
+                    setText(byId('irisApertureStop'), '-');
                 }
             }
-            if (data.gain !== undefined) {
-                actualGainValue = data.gain;
-                document.getElementById('gainValueActual').textContent = data.gain + ' dB';
+            const gain = data.gain;
+            if (gain !== undefined) {
+                actualGainValue = gain;
+                setText(byId('gainValueActual'), gain + ' dB');
                 
                 // Mettre à jour le slider seulement si on n'est pas en train de le manipuler
-                if (!gainSliderLocked) {
-                    const slider = document.getElementById('gainSlider');
+                if (!gainSliderLock.locked) {
+                    const slider = byId('gainSlider');
                     if (slider) {
                         // Trouver la valeur la plus proche dans supportedGains
                         if (supportedGains.length > 0) {
-                            const nearestGain = findNearestGain(data.gain);
-                            slider.value = nearestGain;
+                            slider.value = findNearestGain(gain);
                         } else {
-                            slider.value = data.gain;
+                            slider.value = gain;
                         }
                     }
                 }
             }
-            if (data.shutter !== undefined && data.shutter.shutterSpeed !== undefined) {
-                actualShutterValue = data.shutter.shutterSpeed;
-                document.getElementById('shutterValueActual').textContent = `1/${data.shutter.shutterSpeed}s`;
+            const shutterSpeed = data.shutter !== undefined ? data.shutter.shutterSpeed : undefined;
+            if (shutterSpeed !== undefined) {
+                actualShutterValue = shutterSpeed;
+                setText(byId('shutterValueActual'), `1/${shutterSpeed}s`);
             }
-            if (data.zoom !== undefined) {
-                if (data.zoom.focalLength !== undefined) {
-                    document.getElementById('zoomFocalLength').textContent = data.zoom.focalLength + ' mm';
+            const zoom = data.zoom;
+            if (zoom !== undefined) {
+                if (zoom.focalLength !== undefined) {
+                    setText(byId('zoomFocalLength'), zoom.focalLength + ' mm');
                 }
-                if (data.zoom.normalised !== undefined) {
-                    document.getElementById('zoomNormalised').textContent = data.zoom.normalised.toFixed(3);
+                if (zoom.normalised !== undefined) {
+                    setText(byId('zoomNormalised'), zoom.normalised.toFixed(3));
                 }
             }
-            if (data.zebra !== undefined) {
-                zebraEnabled = data.zebra;
-                updateToggleButton('zebraToggle', data.zebra, 'Zebra');
-            }
-            if (data.focusAssist !== undefined) {
-                focusAssistEnabled = data.focusAssist;
-                updateToggleButton('focusAssistToggle', data.focusAssist, 'Focus Assist');
-            }
-            if (data.falseColor !== undefined) {
-                falseColorEnabled = data.falseColor;
-                updateToggleButton('falseColorToggle', data.falseColor, 'False Color');
-            }
-            if (data.cleanfeed !== undefined) {
-                cleanfeedEnabled = data.cleanfeed;
-                updateToggleButton('cleanfeedToggle', data.cleanfeed, 'Cleanfeed');
+            for (const toggle of TOGGLES) {
+                const enabled = data[toggle.key];
+                if (enabled !== undefined) {
+                    toggle.enabled = enabled;
+                    updateToggleButton(toggle.buttonId, enabled, toggle.label);
+                }
             }
             updateGlobalStatus('connected', 'Connecté');
         }
         
+        // Gestionnaires des sliders, par id : un seul écouteur délégué par type d'événement
+        // au niveau du document, au lieu de cinq attributs inline par slider
+        // Iris et gain : la déduplication des envois ne vaut que pour un glissement. La valeur
+        // envoyée est oubliée au toucher et au relâchement, car la caméra peut avoir changé
+        // entre-temps (autre client, reset, réglage sur le boîtier).
+        const SLIDER_HANDLERS = {
+            focusSlider: { input: updateFocus, touch: focusSliderLock.hold, release: focusSliderLock.release },
+            irisSlider: { input: updateIris, touch: () => { sentIrisApertureStop = null; irisSliderLock.hold(); },
+                          release: () => { sentIrisApertureStop = null; irisSliderLock.release(); } },
+            gainSlider: { input: updateGain, touch: () => { sentGainValue = null; gainSliderLock.hold(); },
+                          release: () => { sentGainValue = null; gainSliderLock.release(); } },
+        };
+        const SLIDER_EVENT_ACTIONS = {
+            input: 'input',
+            mousedown: 'touch',
+            touchstart: 'touch',
+            mouseup: 'release',
+            touchend: 'release',
+        };
+        
+        function dispatchSliderEvent(event) {
+            const target = event.target;
+            const handlers = SLIDER_HANDLERS[target.id];
+            if (!handlers) return;
+            const action = SLIDER_EVENT_ACTIONS[event.type];
+            if (action === 'input') {
+                // Le slider source est déjà connu : le transmettre évite un nouveau getElementById
+                handlers.input(target.value, target);
+            } else {
+                handlers[action]();
+            }
+        }
+        
+        for (const eventType in SLIDER_EVENT_ACTIONS) {
+            document.addEventListener(eventType, dispatchSliderEvent, { passive: true });
+        }
+        
         // Polling de secours pour mettre à jour les valeurs si le WebSocket ne fonctionne pas
         let pollingInterval = null;
-        let lastPollTime = 0;
+        let pollInFlight = false; // Requête de polling en cours : ne pas en lancer une autre
         const POLLING_INTERVAL_MS = 200; // 5 fois par seconde maximum (200ms)
         
         function startPollingFallback() {
@@ -1851,29 +1485,31 @@ HTML_TEMPLATE = """
             if (pollingInterval) return;
             
             pollingInterval = setInterval(() => {
-                const now = Date.now();
-                // Limiter à 5 fois par seconde
-                if (now - lastPollTime >= POLLING_INTERVAL_MS) {
-                    lastPollTime = now;
-                    fetch('/get_initial_values')
-                        .then(response => response.json())
-                        .then(data => {
-                            if (data.success) {
-                                updateValuesFromData(data);
-                                // Stocker la description du zoom si disponible
-                                if (data.zoomDescription) {
-                                    window.zoomDescription = data.zoomDescription;
-                                }
-                                // Charger les ouvertures supportées depuis la description de l'iris
-                                if (data.irisDescription) {
-                                    loadSupportedApertureStopsFromDescription(data.irisDescription);
-                                }
+                // Si la caméra répond plus lentement que l'intervalle, sauter ce tick
+                // plutôt que d'empiler des requêtes /get_initial_values
+                if (pollInFlight) return;
+                pollInFlight = true;
+                fetch('/get_initial_values')
+                    .then(response => response.json())
+                    .then(data => {
+                        if (data.success) {
+                            scheduleValuesUpdate(data);
+                            // Stocker la description du zoom si disponible
+                            if (data.zoomDescription) {
+                                zoomDescription = data.zoomDescription;
                             }
-                        })
-                        .catch(error => {
-                            console.error('Erreur polling:', error);
-                        });
-                }
+                            // Charger les ouvertures supportées depuis la description de l'iris
+                            if (data.irisDescription) {
+                                loadSupportedApertureStopsFromDescription(data.irisDescription);
+                            }
+                        }
+                    })
+                    .catch(error => {
+                        console.error('Erreur polling:', error);
+                    })
+                    .finally(() => {
+                        pollInFlight = false;
+                    });
             }, POLLING_INTERVAL_MS);
         }
         
@@ -1898,6 +1534,33 @@ HTML_TEMPLATE = """
         }
         
         // Fonction d'initialisation Socket.IO
+        // Rendu de la valeur de focus reçue par WebSocket (au plus une fois par frame)
+        // Le focus est affiché (3 décimales) et positionné (step 0.001) au millième :
+        // le texte n'est réécrit que si le millième change depuis le dernier rendu
+        const FOCUS_DISPLAY_STEPS = 1000;
+        let focusRenderScheduled = false;
+        let renderedFocusStep = null;
+        function renderFocusActual() {
+            focusRenderScheduled = false;
+            // Seule l'écriture du texte est évitée si le millième affiché n'a pas changé ;
+            // le slider (hors verrou) et le statut sont toujours resynchronisés
+            const focusStep = Math.round(actualValue * FOCUS_DISPLAY_STEPS);
+            if (focusStep !== renderedFocusStep) {
+                renderedFocusStep = focusStep;
+                setText(byId('focusValueActual'), actualValue.toFixed(3));
+            }
+            
+            // Mettre à jour le slider seulement si on n'est pas en train de le manipuler
+            if (!focusSliderLock.locked) {
+                const slider = byId('focusSlider');
+                if (slider) {
+                    slider.value = actualValue;
+                }
+            }
+            
+            updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
+        }
+        
         function initializeSocketIO() {
             try {
                 console.log('JavaScript: initializeSocketIO executing...');
@@ -1915,6 +1578,9 @@ HTML_TEMPLATE = """
                     // Connexion WebSocket
                     socket = io();
                     console.log('JavaScript: socket = io() called, socket:', socket);
+                    // La première connexion s'appuie sur la lecture HTTP faite au chargement ;
+                    // chaque reconnexion relit les valeurs, qui ont pu changer entre-temps
+                    let socketConnectedOnce = false;
                     
                     // Configurer les handlers Socket.IO
                     if (socket) {
@@ -1922,6 +1588,13 @@ HTML_TEMPLATE = """
                             console.log('JavaScript: Socket.IO connect event received!');
                             updateGlobalStatus('connected', 'Socket.IO: Connecté, attente WebSocket caméra...');
                             console.log('Socket.IO connecté');
+                            if (socketConnectedOnce) {
+                                fetch('/get_initial_values')
+                                    .then(response => response.json())
+                                    .then(data => data.success && scheduleValuesUpdate(data))
+                                    .catch(error => console.error('Erreur relecture valeurs après reconnexion:', error));
+                            }
+                            socketConnectedOnce = true;
                         });
                         
                         socket.on('disconnect', () => {
@@ -1960,18 +1633,11 @@ HTML_TEMPLATE = """
                             const value = data.normalised !== undefined ? data.normalised : data.value;
                             if (value !== null && value !== undefined) {
                                 actualValue = value;
-                                const focusEl = document.getElementById('focusValueActual');
-                                if (focusEl) focusEl.textContent = value.toFixed(3);
-                                
-                                // Mettre à jour le slider seulement si on n'est pas en train de le manipuler
-                                if (!sliderLocked) {
-                                    const slider = document.getElementById('focusSlider');
-                                    if (slider) {
-                                        slider.value = value;
-                                    }
+                                // Regrouper les mises à jour du DOM : une seule écriture par frame
+                                if (!focusRenderScheduled) {
+                                    focusRenderScheduled = true;
+                                    requestAnimationFrame(renderFocusActual);
                                 }
-                                
-                                updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
                             }
                         });
                         
@@ -1985,12 +1651,12 @@ HTML_TEMPLATE = """
                             const apertureStop = data.apertureStop;
                             if (normalised !== null && normalised !== undefined) {
                                 actualIrisValue = normalised;
-                                const irisEl = document.getElementById('irisValueActual');
-                                if (irisEl) irisEl.textContent = normalised.toFixed(3);
+                                const irisEl = byId('irisValueActual');
+                                setText(irisEl, normalised.toFixed(3));
                             }
                             if (apertureStop !== null && apertureStop !== undefined) {
-                                const apertureEl = document.getElementById('irisApertureStop');
-                                if (apertureEl) apertureEl.textContent = apertureStop.toFixed(2);
+                                const apertureEl = byId('irisApertureStop');
+                                setText(apertureEl, apertureStop.toFixed(2));
                             }
                             updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
                         });
@@ -2004,8 +1670,8 @@ HTML_TEMPLATE = """
                             const value = data.gain !== undefined ? data.gain : data.value;
                             if (value !== null && value !== undefined) {
                                 actualGainValue = value;
-                                const gainEl = document.getElementById('gainValueActual');
-                                if (gainEl) gainEl.textContent = value + ' dB';
+                                const gainEl = byId('gainValueActual');
+                                setText(gainEl, value + ' dB');
                                 updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
                             }
                         });
@@ -2019,8 +1685,8 @@ HTML_TEMPLATE = """
                             const value = data.shutterSpeed;
                             if (value !== null && value !== undefined) {
                                 actualShutterValue = value;
-                                const shutterEl = document.getElementById('shutterValueActual');
-                                if (shutterEl) shutterEl.textContent = `1/${value}s`;
+                                const shutterEl = byId('shutterValueActual');
+                                setText(shutterEl, `1/${value}s`);
                                 updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
                             }
                         });
@@ -2034,62 +1700,32 @@ HTML_TEMPLATE = """
                             const focal = data.focalLength;
                             const norm = data.normalised;
                             if (focal !== null && focal !== undefined) {
-                                const focalEl = document.getElementById('zoomFocalLength');
-                                if (focalEl) focalEl.textContent = focal + ' mm';
+                                const focalEl = byId('zoomFocalLength');
+                                setText(focalEl, focal + ' mm');
                             }
                             if (norm !== null && norm !== undefined) {
-                                const normEl = document.getElementById('zoomNormalised');
-                                if (normEl) normEl.textContent = norm.toFixed(3);
-                            }
-                            updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
-                        });
-                        
-                        socket.on('zebra_changed', (data) => {
-                            if (!websocketEventsReceived) {
-                                websocketEventsReceived = true;
-                                stopPollingFallback();
-                                console.log('WebSocket actif, arrêt du polling de secours');
-                            }
-                            const enabled = data.enabled !== undefined ? data.enabled : (data.value !== undefined ? data.value : false);
-                            zebraEnabled = enabled;
-                            updateToggleButton('zebraToggle', enabled, 'Zebra');
-                            updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
-                        });
-                        
-                        socket.on('focusAssist_changed', (data) => {
-                            if (!websocketEventsReceived) {
-                                websocketEventsReceived = true;
-                                stopPollingFallback();
-                                console.log('WebSocket actif, arrêt du polling de secours');
-                            }
-                            const enabled = data.enabled !== undefined ? data.enabled : (data.value !== undefined ? data.value : false);
-                            focusAssistEnabled = enabled;
-                            updateToggleButton('focusAssistToggle', enabled, 'Focus Assist');
-                            updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
-                        });
-                        
-                        socket.on('falseColor_changed', (data) => {
-                            if (!websocketEventsReceived) {
-                                websocketEventsReceived = true;
-                                stopPollingFallback();
-                                console.log('WebSocket actif, arrêt du polling de secours');
+                                const normEl = byId('zoomNormalised');
+                                setText(normEl, norm.toFixed(3));
                             }
-                            const enabled = data.enabled !== undefined ? data.enabled : (data.value !== undefined ? data.value : false);
-                            falseColorEnabled = enabled;
-                            updateToggleButton('falseColorToggle', enabled, 'False Color');
                             updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
                         });
                         
-                        socket.on('cleanfeed_changed', (data) => {
-                            if (!websocketEventsReceived) {
-                                websocketEventsReceived = true;
-                                stopPollingFallback();
-                                console.log('WebSocket actif, arrêt du polling de secours');
-                            }
-                            const enabled = data.enabled !== undefined ? data.enabled : (data.value !== undefined ? data.value : false);
-                            cleanfeedEnabled = enabled;
-                            updateToggleButton('cleanfeedToggle', enabled, 'Cleanfeed');
-                            updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
+                        // Un même handler pour les quatre toggles (voir TOGGLES)
+                        // Bouton et textes résolus une fois à l'enregistrement, pas à chaque événement
+                        TOGGLES.forEach(toggle => {
+                            const button = byId(toggle.buttonId);
+                            const texts = TOGGLE_LABELS[toggle.label];
+                            socket.on(toggle.event, (data) => {
+                                if (!websocketEventsReceived) {
+                                    websocketEventsReceived = true;
+                                    stopPollingFallback();
+                                    console.log('WebSocket actif, arrêt du polling de secours');
+                                }
+                                const enabled = data.enabled !== undefined ? data.enabled : (data.value !== undefined ? data.value : false);
+                                toggle.enabled = enabled;
+                                applyToggleButton(button, enabled, texts);
+                                updateGlobalStatus('connected', 'WebSocket caméra: Actif ✓');
+                            });
                         });
                     }
                 }
@@ -2109,27 +1745,31 @@ HTML_TEMPLATE = """
                 // Charger les valeurs supportées (gain, shutter, iris)
                 loadSupportedGains();
                 loadSupportedShutters();
-                loadSupportedApertureStops();
-                // Récupérer les valeurs initiales via HTTP (fallback si WebSocket ne fonctionne pas)
+                // Récupérer les valeurs initiales via HTTP (fallback si WebSocket ne fonctionne pas) ;
+                // la même réponse fournit la description de l'iris (ouvertures supportées)
                 fetch('/get_initial_values')
                     .then(response => response.json())
                     .then(data => {
                         if (data.success) {
-                            updateValuesFromData(data);
+                            scheduleValuesUpdate(data);
                             // Stocker la description du zoom si disponible
                             if (data.zoomDescription) {
-                                window.zoomDescription = data.zoomDescription;
+                                zoomDescription = data.zoomDescription;
                                 console.log('Description du zoom récupérée:', data.zoomDescription);
                             }
-                            // Charger les ouvertures supportées depuis la description de l'iris
-                            if (data.irisDescription) {
-                                loadSupportedApertureStopsFromDescription(data.irisDescription);
-                            }
                             console.log('Valeurs initiales récupérées via HTTP');
                         }
+                        // Charger les ouvertures supportées depuis la description de l'iris
+                        if (data.success && data.irisDescription) {
+                            loadSupportedApertureStopsFromDescription(data.irisDescription);
+                        } else {
+                            console.warn('Description de l\\'iris indisponible, utilisation de valeurs par défaut');
+                            useDefaultApertureStops();
+                        }
                     })
                     .catch(error => {
                         console.error('Erreur récupération valeurs initiales:', error);
+                        useDefaultApertureStops();
                     });
                 
                 // Démarrer le polling de secours après 2 secondes
@@ -2154,21 +1794,40 @@ def index():
     """Page principale avec l'interface."""
     if controller is None:
         return "Erreur: Contrôleur non initialisé. Vérifiez les paramètres de connexion.", 500
+    global rendered_index
     try:
-        result = render_template_string(HTML_TEMPLATE)
-        return result
+        # Le template est statique : le compiler et le rendre une seule fois
+        if rendered_index is None:
+            rendered_index = render_template_string(HTML_TEMPLATE)
+        return rendered_index
     except Exception as e:
         logging.error(f"Erreur lors du rendu du template: {e}")
         return f"Erreur lors du rendu de la page: {str(e)}", 500
 
+def parse_normalised(data: dict, key: str, default: float) -> Optional[float]:
+    """
+    Lit une valeur normalisée (0.0 à 1.0) d'une requête JSON.
+    
+    Args:
+        data: Corps JSON de la requête
+        key: Champ à lire
+        default: Valeur si le champ est absent
+    
+    Returns:
+        La valeur, ou None si elle est hors de l'intervalle [0.0, 1.0]
+    
+    Raises:
+        ValueError, TypeError: si le champ n'est pas un nombre
+    """
+    value = float(data.get(key, default))
+    return value if 0.0 <= value <= 1.0 else None
+
 @app.route('/set_focus', methods=['POST'])
 def set_focus():
     """Définit la valeur du focus."""
     try:
-        data = request.json
-        value = float(data.get('value', 0))
-        
-        if not 0.0 <= value <= 1.0:
+        value = parse_normalised(request.json, 'value', 0)
+        if value is None:
             return jsonify({'success': False, 'error': 'Valeur doit être entre 0.0 et 1.0'})
         
         success = controller.set_focus(value, silent=True)
@@ -2183,10 +1842,8 @@ def set_focus():
 def set_iris():
     """Définit la valeur de l'iris."""
     try:
-        data = request.json
-        value = float(data.get('value', 0))
-        
-        if not 0.0 <= value <= 1.0:
+        value = parse_normalised(request.json, 'value', 0)
+        if value is None:
             return jsonify({'success': False, 'error': 'Valeur doit être entre 0.0 et 1.0'})
         
         success = controller.set_iris(value, silent=True)
@@ -2243,7 +1900,7 @@ def set_shutter_measurement():
         data = request.json
         mode = data.get('measurement')
         
-        if mode not in ['ShutterAngle', 'ShutterSpeed']:
+        if mode not in SHUTTER_MEASUREMENT_MODES:
             return jsonify({'success': False, 'error': 'Mode doit être ShutterAngle ou ShutterSpeed'})
         
         success = controller.set_shutter_measurement(mode, silent=True)
@@ -2284,124 +1941,69 @@ def set_shutter():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
-@app.route('/get_zebra', methods=['GET'])
-def get_zebra():
-    """Récupère l'état actuel du Zebra."""
-    try:
-        enabled = controller.get_zebra()
-        if enabled is not None:
-            return jsonify({'success': True, 'enabled': enabled})
-        else:
-            return jsonify({'success': False, 'error': 'Impossible de récupérer l\'état du Zebra'})
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
+# Paramètres d'affichage on/off exposés par des routes get_<nom>/set_<nom> identiques
+# (nom des routes et des méthodes du contrôleur, libellé pour les messages d'erreur)
+TOGGLE_ROUTES = (
+    ('zebra', 'Zebra'),
+    ('focus_assist', 'Focus Assist'),
+    ('false_color', 'False Color'),
+    ('cleanfeed', 'Cleanfeed'),
+)
 
-@app.route('/set_zebra', methods=['POST'])
-def set_zebra():
-    """Active ou désactive le Zebra."""
-    try:
-        data = request.json
-        enabled = bool(data.get('enabled', False))
-        
-        success = controller.set_zebra(enabled, silent=True)
-        if success:
-            return jsonify({'success': True, 'enabled': enabled})
-        else:
-            return jsonify({'success': False, 'error': 'Impossible de définir l\'état du Zebra'})
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
-
-@app.route('/get_focus_assist', methods=['GET'])
-def get_focus_assist():
-    """Récupère l'état actuel du Focus Assist."""
-    try:
-        enabled = controller.get_focus_assist()
-        if enabled is not None:
-            return jsonify({'success': True, 'enabled': enabled})
-        else:
-            return jsonify({'success': False, 'error': 'Impossible de récupérer l\'état du Focus Assist'})
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
-
-@app.route('/set_focus_assist', methods=['POST'])
-def set_focus_assist():
-    """Active ou désactive le Focus Assist."""
-    try:
-        data = request.json
-        enabled = bool(data.get('enabled', False))
-        
-        success = controller.set_focus_assist(enabled, silent=True)
-        if success:
-            return jsonify({'success': True, 'enabled': enabled})
-        else:
-            return jsonify({'success': False, 'error': 'Impossible de définir l\'état du Focus Assist'})
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
-
-@app.route('/get_false_color', methods=['GET'])
-def get_false_color():
-    """Récupère l'état actuel du False Color."""
-    try:
-        enabled = controller.get_false_color()
-        if enabled is not None:
-            return jsonify({'success': True, 'enabled': enabled})
-        else:
-            return jsonify({'success': False, 'error': 'Impossible de récupérer l\'état du False Color'})
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
+def register_toggle_routes(name: str, label: str):
+    """
+    Enregistre les routes /get_<name> et /set_<name> d'un paramètre on/off.
+    
+    Args:
+        name: Nom du paramètre (utilisé pour les routes et les méthodes get_/set_ du contrôleur)
+        label: Libellé affiché dans les messages d'erreur
+    """
+    def get_toggle():
+        """Récupère l'état actuel du paramètre."""
+        try:
+            enabled = getattr(controller, f'get_{name}')()
+            if enabled is not None:
+                return jsonify({'success': True, 'enabled': enabled})
+            else:
+                return jsonify({'success': False, 'error': f"Impossible de récupérer l'état du {label}"})
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)})
+    
+    def set_toggle():
+        """Active ou désactive le paramètre."""
+        try:
+            data = request.json
+            enabled = bool(data.get('enabled', False))
+            
+            success = getattr(controller, f'set_{name}')(enabled, silent=True)
+            if success:
+                return jsonify({'success': True, 'enabled': enabled})
+            else:
+                return jsonify({'success': False, 'error': f"Impossible de définir l'état du {label}"})
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)})
+    
+    app.add_url_rule(f'/get_{name}', f'get_{name}', get_toggle, methods=['GET'])
+    app.add_url_rule(f'/set_{name}', f'set_{name}', set_toggle, methods=['POST'])
 
-@app.route('/set_false_color', methods=['POST'])
-def set_false_color():
-    """Active ou désactive le False Color."""
-    try:
-        data = request.json
-        enabled = bool(data.get('enabled', False))
-        
-        success = controller.set_false_color(enabled, silent=True)
-        if success:
-            return jsonify({'success': True, 'enabled': enabled})
-        else:
-            return jsonify({'success': False, 'error': 'Impossible de définir l\'état du False Color'})
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
+for toggle_name, toggle_label in TOGGLE_ROUTES:
+    register_toggle_routes(toggle_name, toggle_label)
 
-@app.route('/get_cleanfeed', methods=['GET'])
-def get_cleanfeed():
-    """Récupère l'état actuel du Cleanfeed."""
-    try:
-        enabled = controller.get_cleanfeed()
-        if enabled is not None:
-            return jsonify({'success': True, 'enabled': enabled})
-        else:
-            return jsonify({'success': False, 'error': 'Impossible de récupérer l\'état du Cleanfeed'})
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
-
-@app.route('/set_cleanfeed', methods=['POST'])
-def set_cleanfeed():
-    """Active ou désactive le Cleanfeed."""
-    try:
-        data = request.json
-        enabled = bool(data.get('enabled', False))
-        
-        success = controller.set_cleanfeed(enabled, silent=True)
-        if success:
-            return jsonify({'success': True, 'enabled': enabled})
-        else:
-            return jsonify({'success': False, 'error': 'Impossible de définir l\'état du Cleanfeed'})
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
+# Un seul autofocus à la fois : les requêtes concurrentes (plusieurs onglets) sont refusées
+autofocus_lock = threading.Lock()
 
 @app.route('/do_autofocus', methods=['POST'])
 def do_autofocus():
     """Lance l'autofocus à une position donnée."""
+    if not autofocus_lock.acquire(blocking=False):
+        return jsonify({'success': False, 'error': 'Autofocus déjà en cours'})
     try:
         data = request.json or {}
-        x = float(data.get('x', 0.5))
-        y = float(data.get('y', 0.5))
+        x = parse_normalised(data, 'x', 0.5)
+        y = parse_normalised(data, 'y', 0.5)
         
         # Valider les valeurs
-        if not (0.0 <= x <= 1.0) or not (0.0 <= y <= 1.0):
+        if x is None or y is None:
             return jsonify({'success': False, 'error': 'Les positions doivent être entre 0.0 et 1.0'})
         
         success = controller.do_autofocus(x=x, y=y, silent=True)
@@ -2412,121 +2014,116 @@ def do_autofocus():
             # Retourner plus d'informations sur l'erreur
             return jsonify({'success': False, 'error': 'Impossible de déclencher l\'autofocus. Vérifiez les logs du serveur pour plus de détails.'})
     except Exception as e:
-        import traceback
         logging.error(f"Erreur dans do_autofocus: {e}\n{traceback.format_exc()}")
         return jsonify({'success': False, 'error': f'Erreur: {str(e)}'})
+    finally:
+        autofocus_lock.release()
+
+# Valeurs renvoyées par /get_initial_values : (clé JSON, méthode du contrôleur, message d'erreur)
+# Le message d'erreur vaut None pour les valeurs dont l'échec est ignoré silencieusement
+INITIAL_VALUE_GETTERS = (
+    # Descriptions (pour connaître la focale et les stops supportés)
+    ('zoomDescription', 'get_zoom_description', "Erreur lors de la récupération de la description du zoom"),
+    ('irisDescription', 'get_iris_description', "Erreur lors de la récupération de la description de l'iris"),
+    # Valeurs principales (focus, iris, gain, shutter, zoom)
+    ('focus', 'get_focus', None),
+    ('iris', 'get_iris', None),
+    ('gain', 'get_gain', None),
+    ('shutter', 'get_shutter', None),
+    ('zoom', 'get_zoom', None),
+    # Valeurs optionnelles : les endpoints peuvent ne pas exister (404)
+    ('zebra', 'get_zebra', None),
+    ('focusAssist', 'get_focus_assist', None),
+    ('falseColor', 'get_false_color', None),
+    ('cleanfeed', 'get_cleanfeed', None),
+)
+# Valeurs dont au moins une doit être lue pour que /get_initial_values réussisse
+ESSENTIAL_VALUE_KEYS = frozenset(('focus', 'iris', 'gain', 'shutter', 'zoom'))
+# Nombre de requêtes HTTP simultanées vers la caméra (reste sous la taille du pool de connexions)
+INITIAL_VALUES_WORKERS = 6
+# Durée pendant laquelle une réponse de /get_initial_values est réutilisée (plusieurs onglets
+# qui interrogent en même temps ne déclenchent qu'une série de requêtes vers la caméra)
+INITIAL_VALUES_CACHE_TTL = 0.15  # secondes
+initial_values_cache = None  # (instant monotonic, résultat)
+initial_values_lock = threading.Lock()
+# Pool de threads créé une fois et réutilisé : le polling de secours appelle
+# /get_initial_values plusieurs fois par seconde
+initial_values_pool = ThreadPoolExecutor(max_workers=INITIAL_VALUES_WORKERS,
+                                         thread_name_prefix='initial-values')
 
 @app.route('/get_initial_values', methods=['GET'])
 def get_initial_values():
     """Récupère toutes les valeurs initiales via HTTP (fallback si WebSocket ne fonctionne pas)."""
+    global initial_values_cache
+    # Un seul calcul à la fois : les requêtes concurrentes attendent et réutilisent le résultat
+    with initial_values_lock:
+        cached = initial_values_cache
+        if cached is not None and time.monotonic() - cached[0] < INITIAL_VALUES_CACHE_TTL:
+            result = cached[1]
+        else:
+            result = collect_initial_values()
+            initial_values_cache = (time.monotonic(), result)
+    return jsonify(result)
+
+
+def collect_initial_values() -> dict:
+    """Interroge la caméra et retourne le dict renvoyé par /get_initial_values."""
     result = {'success': True}
+    essential_found = False
     
-    # Récupérer la description du zoom
-    try:
-        zoom_description = controller.get_zoom_description()
-        if zoom_description is not None:
-            result['zoomDescription'] = zoom_description
-    except Exception as e:
-        logging.error(f"Erreur lors de la récupération de la description du zoom: {e}")
-    
-    # Récupérer la description de l'iris (pour connaître les stops supportés)
-    try:
-        iris_description = controller.get_iris_description()
-        if iris_description is not None:
-            result['irisDescription'] = iris_description
-    except Exception as e:
-        logging.error(f"Erreur lors de la récupération de la description de l'iris: {e}")
-    
-    # Récupérer les valeurs principales (focus, iris, gain, shutter, zoom)
-    # Ces valeurs sont essentielles et doivent fonctionner
-    try:
-        focus_value = controller.get_focus()
-        if focus_value is not None:
-            result['focus'] = focus_value
-    except Exception as e:
-        pass  # Ignorer les erreurs pour les valeurs optionnelles
-    
-    try:
-        iris_data = controller.get_iris()
-        if iris_data is not None:
-            result['iris'] = iris_data
-    except Exception as e:
-        pass
-    
-    try:
-        gain_value = controller.get_gain()
-        if gain_value is not None:
-            result['gain'] = gain_value
-    except Exception as e:
-        pass
-    
-    try:
-        shutter_data = controller.get_shutter()
-        if shutter_data is not None:
-            result['shutter'] = shutter_data
-    except Exception as e:
-        pass
-    
-    try:
-        zoom_data = controller.get_zoom()
-        if zoom_data is not None:
-            result['zoom'] = zoom_data
-    except Exception as e:
-        pass
-    
-    # Récupérer les valeurs optionnelles (zebra, focusAssist, falseColor, cleanfeed)
-    # Ces valeurs peuvent échouer si les endpoints ne sont pas disponibles
-    try:
-        zebra_enabled = controller.get_zebra()
-        if zebra_enabled is not None:
-            result['zebra'] = zebra_enabled
-    except Exception as e:
-        pass  # Ignorer les erreurs 404 pour les endpoints optionnels
-    
-    try:
-        focus_assist_enabled = controller.get_focus_assist()
-        if focus_assist_enabled is not None:
-            result['focusAssist'] = focus_assist_enabled
-    except Exception as e:
-        pass
-    
-    try:
-        false_color_enabled = controller.get_false_color()
-        if false_color_enabled is not None:
-            result['falseColor'] = false_color_enabled
-    except Exception as e:
-        pass
-    
-    try:
-        cleanfeed_enabled = controller.get_cleanfeed()
-        if cleanfeed_enabled is not None:
-            result['cleanfeed'] = cleanfeed_enabled
-    except Exception as e:
-        pass
+    # L'API ne permet pas de lire plusieurs paramètres en une requête : les requêtes
+    # sont lancées en parallèle pour ne payer qu'environ une latence réseau au lieu de onze
+    submit = initial_values_pool.submit
+    futures = [(key, error_message, submit(getattr(controller, getter)))
+               for key, getter, error_message in INITIAL_VALUE_GETTERS]
+    for key, error_message, future in futures:
+        try:
+            value = future.result()
+            if value is not None:
+                result[key] = value
+                essential_found = essential_found or key in ESSENTIAL_VALUE_KEYS
+        except Exception as e:
+            if error_message:
+                logging.error(f"{error_message}: {e}")
     
-    # Retourner success: True si au moins une valeur a été récupérée
-    # (focus, iris, gain, shutter, ou zoom)
-    if any(key in result for key in ['focus', 'iris', 'gain', 'shutter', 'zoom']):
-        result['success'] = True
-    else:
+    # Retourner success: True si au moins une valeur essentielle a été récupérée
+    # (focus, iris, gain, shutter, ou zoom), suivi au fil de la collecte
+    if not essential_found:
         result['success'] = False
         result['error'] = 'Aucune valeur n\'a pu être récupérée'
     
-    return jsonify(result)
+    return result
 
 # Fonction pour traiter la queue d'événements
 def process_event_queue():
-    """Traite la queue d'événements et les émet via Socket.IO."""
+    """
+    Traite la queue d'événements et les émet via Socket.IO.
+    
+    Les événements accumulés pendant une émission sont regroupés : seul le plus récent
+    de chaque type est émis (chaque événement porte l'état complet du paramètre).
+    """
     while True:
         try:
-            event_name, data = event_queue.get(timeout=0.1)
-            try:
-                socketio.emit(event_name, data)
-            except Exception as emit_error:
-                logging.error(f"Erreur lors de l'émission Socket.IO: {emit_error}")
-            event_queue.task_done()
-        except queue.Empty:
-            continue
+            # Attente bloquante : le thread ne se réveille que lorsqu'un événement arrive
+            event_name, data = event_queue.get()
+            latest = {event_name: data}
+            received = 1
+            while True:
+                try:
+                    event_name, data = event_queue.get_nowait()
+                except queue.Empty:
+                    break
+                # Réinsérer pour conserver l'ordre de la dernière occurrence
+                latest.pop(event_name, None)
+                latest[event_name] = data
+                received += 1
+            for event_name, data in latest.items():
+                try:
+                    socketio.emit(event_name, data)
+                except Exception as emit_error:
+                    logging.error(f"Erreur lors de l'émission Socket.IO: {emit_error}")
+            for _ in range(received):
+                event_queue.task_done()
         except Exception as e:
             logging.error(f"Erreur lors du traitement de la queue d'événements: {e}")
 
@@ -2552,30 +2149,8 @@ def handle_connect():
     except Exception as queue_err:
         logging.error(f"Erreur lors de l'ajout du statut WebSocket à la queue: {queue_err}")
     
-    # Envoyer les valeurs initiales via HTTP (fallback si WebSocket ne fonctionne pas)
-    try:
-        # Récupérer les valeurs initiales via HTTP
-        focus_value = controller.get_focus()
-        if focus_value is not None:
-            emit('focus_changed', {'normalised': focus_value})
-        
-        iris_data = controller.get_iris()
-        if iris_data is not None:
-            emit('iris_changed', iris_data)
-        
-        gain_value = controller.get_gain()
-        if gain_value is not None:
-            emit('gain_changed', {'gain': gain_value})
-        
-        shutter_data = controller.get_shutter()
-        if shutter_data is not None:
-            emit('shutter_changed', shutter_data)
-        
-        zoom_data = controller.get_zoom()
-        if zoom_data is not None:
-            emit('zoom_changed', zoom_data)
-    except Exception as e:
-        logging.error(f"Erreur lors de la récupération des valeurs initiales: {e}")
+    # Les valeurs initiales ne sont pas relues ici : la page les récupère via
+    # /get_initial_values au chargement, puis à chaque reconnexion Socket.IO
 
 @socketio.on('disconnect')
 def handle_disconnect():
@@ -2591,7 +2166,15 @@ def on_websocket_connection_status(connected: bool, message: str):
         connected: True si connecté, False sinon
         message: Message décrivant l'état
     """
+    global last_websocket_status
     try:
+        # Pendant les tentatives de reconnexion, la même erreur revient toutes les
+        # quelques secondes : ne journaliser et diffuser que les changements d'état
+        status = (connected, message)
+        if status == last_websocket_status:
+            return
+        last_websocket_status = status
+        
         event_data = {
             'connected': connected,
             'message': message
@@ -2601,6 +2184,36 @@ def on_websocket_connection_status(connected: bool, message: str):
     except Exception as e:
         logging.error(f"Erreur lors de l'émission de l'état WebSocket: {e}")
 
+def is_negligible_change(previous: dict, data: dict) -> bool:
+    """
+    Indique si un nouvel état ne diffère du précédent que d'une variation négligeable.
+    
+    Les champs 'normalised' sont comparés arrondis à NORMALISED_DISPLAY_DECIMALS :
+    toute variation qui change l'affichage est réémise, y compris la position finale
+    d'un objectif qui s'arrête à moins d'un millième de la dernière valeur émise.
+    Les autres champs doivent être strictement identiques.
+    """
+    if not isinstance(previous, dict) or not isinstance(data, dict) or previous.keys() != data.keys():
+        return False
+    # Seul 'normalised' admet une tolérance : il est traité une fois, hors de la boucle
+    value = data.get('normalised')
+    old_value = previous.get('normalised')
+    if not (isinstance(value, (int, float)) and isinstance(old_value, (int, float))):
+        return previous == data
+    if round(value, NORMALISED_DISPLAY_DECIMALS) != round(old_value, NORMALISED_DISPLAY_DECIMALS):
+        return False
+    for key, value in data.items():
+        if key != 'normalised' and value != previous[key]:
+            return False
+    return True
+
+# Nom de l'événement Socket.IO émis pour chaque type de paramètre
+PARAMETER_EVENT_NAMES = {
+    param_type: f"{param_type}_changed"
+    for param_type in ('focus', 'iris', 'gain', 'shutter', 'zoom',
+                       'zebra', 'focusAssist', 'falseColor', 'cleanfeed')
+}
+
 def on_parameter_change(param_type: str, data: dict):
     """
     Callback appelé quand un paramètre change via WebSocket.
@@ -2611,8 +2224,14 @@ def on_parameter_change(param_type: str, data: dict):
         data: Données du paramètre (format dict avec les champs de l'API REST)
     """
     try:
+        # Ne pas réémettre une valeur qui n'a pas bougé de manière perceptible
+        previous = last_emitted_values.get(param_type)
+        if previous is not None and is_negligible_change(previous, data):
+            return
+        last_emitted_values[param_type] = data
+        
         # Émettre l'événement vers tous les clients via une queue
-        event_name = f"{param_type}_changed"
+        event_name = PARAMETER_EVENT_NAMES.get(param_type) or f"{param_type}_changed"
         # Les données sont déjà dans le format de l'API REST (ex: {'normalised': 0.5} pour focus)
         # Depuis un thread externe, utiliser une queue pour émettre dans le bon contexte Flask-SocketIO
         try:
@@ -2620,24 +2239,19 @@ def on_parameter_change(param_type: str, data: dict):
         except Exception as queue_error:
             logging.error(f"Erreur lors de l'ajout à la queue: {queue_error}")
         
-        logging.debug(f"Événement émis: {event_name} avec données: {data}")
+        logging.debug("Événement émis: %s avec données: %s", event_name, data)
     except Exception as e:
         logging.error(f"Erreur lors de l'émission de l'événement {param_type}: {e}")
-        import traceback
         logging.error(traceback.format_exc())
 
 def main():
     """Fonction principale."""
+    if DEBUG_LOG:
+        threading.Thread(target=debug_log_flush_loop, daemon=True).start()
+        # Le thread de vidage est daemon : écrire les dernières entrées à la sortie
+        atexit.register(flush_debug_log)
     # #region agent log
-    import json
-    import time
-    import os
-    try:
-        os.makedirs(os.path.dirname('/Users/laurenteyen/Documents/cursor/FocusBMrestAPI1/.cursor/debug.log'), exist_ok=True)
-        with open('/Users/laurenteyen/Documents/cursor/FocusBMrestAPI1/.cursor/debug.log', 'a') as f:
-            f.write(json.dumps({'location':'focus_ui.py:main:start','message':'main() function called','data':{'cwd':os.getcwd(),'script_path':__file__},'timestamp':int(time.time()*1000),'sessionId':'debug-session','runId':'start-sh-debug','hypothesisId':'A'})+'\n')
-    except:
-        pass
+    debug_log('focus_ui.py:main:start', 'main() function called', lambda: {'cwd':os.getcwd(),'script_path':__file__}, 'A')
     # #endregion
     
     parser = argparse.ArgumentParser(
@@ -2681,61 +2295,35 @@ def main():
     args = parser.parse_args()
     
     # #region agent log
-    try:
-        with open('/Users/laurenteyen/Documents/cursor/FocusBMrestAPI1/.cursor/debug.log', 'a') as f:
-            f.write(json.dumps({'location':'focus_ui.py:main:args_parsed','message':'Arguments parsed','data':{'url':args.url,'user':args.user,'port':args.port,'host':args.host},'timestamp':int(time.time()*1000),'sessionId':'debug-session','runId':'start-sh-debug','hypothesisId':'A'})+'\n')
-    except:
-        pass
+    debug_log('focus_ui.py:main:args_parsed', 'Arguments parsed', lambda: {'url':args.url,'user':args.user,'port':args.port,'host':args.host}, 'A')
     # #endregion
     
     # Désactiver les avertissements SSL
-    import urllib3
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
     
     # Créer le contrôleur
     global controller, websocket_client
-<<<<<<< HEAD
     # #region agent log
-    try:
-        with open('/Users/laurenteyen/Documents/cursor/FocusBMrestAPI1/.cursor/debug.log', 'a') as f:
-            f.write(json.dumps({'location':'focus_ui.py:main:before_controller','message':'Before creating controller','data':{'url':args.url,'user':args.user},'timestamp':int(time.time()*1000),'sessionId':'debug-session','runId':'start-sh-debug','hypothesisId':'B'})+'\n')
-    except:
-        pass
+    debug_log('focus_ui.py:main:before_controller', 'Before creating controller', lambda: {'url':args.url,'user':args.user}, 'B')
     # #endregion
     
     try:
         controller = BlackmagicFocusController(args.url, args.user, args.password)
+        logging.info("Contrôleur initialisé avec succès")
         # #region agent log
-        try:
-            with open('/Users/laurenteyen/Documents/cursor/FocusBMrestAPI1/.cursor/debug.log', 'a') as f:
-                f.write(json.dumps({'location':'focus_ui.py:main:controller_created','message':'Controller created successfully','data':{'controller_exists':controller is not None},'timestamp':int(time.time()*1000),'sessionId':'debug-session','runId':'start-sh-debug','hypothesisId':'B'})+'\n')
-        except:
-            pass
+        debug_log('focus_ui.py:main:controller_created', 'Controller created successfully', lambda: {'controller_exists':controller is not None}, 'B')
         # #endregion
     except Exception as e:
+        logging.error(f"Erreur lors de l'initialisation du contrôleur: {e}")
         # #region agent log
-        try:
-            with open('/Users/laurenteyen/Documents/cursor/FocusBMrestAPI1/.cursor/debug.log', 'a') as f:
-                f.write(json.dumps({'location':'focus_ui.py:main:controller_error','message':'Error creating controller','data':{'error':str(e),'error_type':type(e).__name__},'timestamp':int(time.time()*1000),'sessionId':'debug-session','runId':'start-sh-debug','hypothesisId':'B'})+'\n')
-        except:
-            pass
+        debug_log('focus_ui.py:main:controller_error', 'Error creating controller', lambda: {'error':str(e),'error_type':type(e).__name__}, 'B')
+        flush_debug_log()
         # #endregion
-=======
-    try:
-        controller = BlackmagicFocusController(args.url, args.user, args.password)
-        logging.info("Contrôleur initialisé avec succès")
-    except Exception as e:
-        logging.error(f"Erreur lors de l'initialisation du contrôleur: {e}")
->>>>>>> 28f77b6d7fecd32c78e5333a11555f25ceedf063
         raise
     
     # Démarrer le thread qui traite la queue d'événements
     # #region agent log
-    try:
-        with open('/Users/laurenteyen/Documents/cursor/FocusBMrestAPI1/.cursor/debug.log', 'a') as f:
-            f.write(json.dumps({'location':'focus_ui.py:main:before_queue_thread','message':'Before starting queue thread','data':{},'timestamp':int(time.time()*1000),'sessionId':'debug-session','runId':'start-sh-debug','hypothesisId':'C'})+'\n')
-    except:
-        pass
+    debug_log('focus_ui.py:main:before_queue_thread', 'Before starting queue thread', lambda: {}, 'C')
     # #endregion
     
     queue_thread = threading.Thread(target=process_event_queue, daemon=True)
@@ -2743,22 +2331,14 @@ def main():
     logging.info("Thread de traitement de la queue d'événements démarré")
     
     # #region agent log
-    try:
-        with open('/Users/laurenteyen/Documents/cursor/FocusBMrestAPI1/.cursor/debug.log', 'a') as f:
-            f.write(json.dumps({'location':'focus_ui.py:main:queue_thread_started','message':'Queue thread started','data':{},'timestamp':int(time.time()*1000),'sessionId':'debug-session','runId':'start-sh-debug','hypothesisId':'C'})+'\n')
-    except:
-        pass
+    debug_log('focus_ui.py:main:queue_thread_started', 'Queue thread started', lambda: {}, 'C')
     # #endregion
     
     # Créer et démarrer le client WebSocket (sauf si désactivé)
     websocket_client = None
     if not args.no_websocket:
         # #region agent log
-        try:
-            with open('/Users/laurenteyen/Documents/cursor/FocusBMrestAPI1/.cursor/debug.log', 'a') as f:
-                f.write(json.dumps({'location':'focus_ui.py:main:before_websocket','message':'Before creating websocket client','data':{},'timestamp':int(time.time()*1000),'sessionId':'debug-session','runId':'start-sh-debug','hypothesisId':'D'})+'\n')
-        except:
-            pass
+        debug_log('focus_ui.py:main:before_websocket', 'Before creating websocket client', lambda: {}, 'D')
         # #endregion
         
         try:
@@ -2772,19 +2352,11 @@ def main():
             websocket_client.start()
             logging.info("Client WebSocket démarré")
             # #region agent log
-            try:
-                with open('/Users/laurenteyen/Documents/cursor/FocusBMrestAPI1/.cursor/debug.log', 'a') as f:
-                    f.write(json.dumps({'location':'focus_ui.py:main:websocket_started','message':'WebSocket client started','data':{'websocket_exists':websocket_client is not None},'timestamp':int(time.time()*1000),'sessionId':'debug-session','runId':'start-sh-debug','hypothesisId':'D'})+'\n')
-            except:
-                pass
+            debug_log('focus_ui.py:main:websocket_started', 'WebSocket client started', lambda: {'websocket_exists':websocket_client is not None}, 'D')
             # #endregion
         except Exception as e:
             # #region agent log
-            try:
-                with open('/Users/laurenteyen/Documents/cursor/FocusBMrestAPI1/.cursor/debug.log', 'a') as f:
-                    f.write(json.dumps({'location':'focus_ui.py:main:websocket_error','message':'Error starting websocket','data':{'error':str(e),'error_type':type(e).__name__},'timestamp':int(time.time()*1000),'sessionId':'debug-session','runId':'start-sh-debug','hypothesisId':'D'})+'\n')
-            except:
-                pass
+            debug_log('focus_ui.py:main:websocket_error', 'Error starting websocket', lambda: {'error':str(e),'error_type':type(e).__name__}, 'D')
             # #endregion
             logging.error(f"Erreur lors du démarrage du client WebSocket: {e}")
             logging.warning("Le WebSocket n'est pas disponible, mais le serveur Flask continue...")
@@ -2805,11 +2377,7 @@ def main():
     print(f"Appuyez sur Ctrl+C pour arrêter\n")
     
     # #region agent log
-    try:
-        with open('/Users/laurenteyen/Documents/cursor/FocusBMrestAPI1/.cursor/debug.log', 'a') as f:
-            f.write(json.dumps({'location':'focus_ui.py:main:before_socketio_run','message':'Before socketio.run()','data':{'host':args.host,'port':args.port},'timestamp':int(time.time()*1000),'sessionId':'debug-session','runId':'start-sh-debug','hypothesisId':'E'})+'\n')
-    except:
-        pass
+    debug_log('focus_ui.py:main:before_socketio_run', 'Before socketio.run()', lambda: {'host':args.host,'port':args.port}, 'E')
     # #endregion
     
     # Démarrer le serveur Flask avec SocketIO
@@ -2817,11 +2385,8 @@ def main():
         socketio.run(app, host=args.host, port=args.port, debug=False, allow_unsafe_werkzeug=True)
     except Exception as e:
         # #region agent log
-        try:
-            with open('/Users/laurenteyen/Documents/cursor/FocusBMrestAPI1/.cursor/debug.log', 'a') as f:
-                f.write(json.dumps({'location':'focus_ui.py:main:socketio_error','message':'Error in socketio.run()','data':{'error':str(e),'error_type':type(e).__name__},'timestamp':int(time.time()*1000),'sessionId':'debug-session','runId':'start-sh-debug','hypothesisId':'E'})+'\n')
-        except:
-            pass
+        debug_log('focus_ui.py:main:socketio_error', 'Error in socketio.run()', lambda: {'error':str(e),'error_type':type(e).__name__}, 'E')
+        flush_debug_log()
         # #endregion
         raise
 